@@ -19,6 +19,7 @@ from .errors import MusicBotError
 from .player import PlayerManager
 from .source import YTDLSource
 from .ui import Embeds, respond
+from .views import NowPlayingControl, RemoveTrackButton
 
 log = logging.getLogger(__name__)
 
@@ -54,6 +55,7 @@ class MusicBot(commands.Bot):
 
     async def setup_hook(self) -> None:
         await self.add_cog(Music(self))
+        self.add_dynamic_items(NowPlayingControl, RemoveTrackButton)
         current = self._tree_hash()
         if self._read_synced_hash() == current:
             log.info("Application commands unchanged; skipping sync")
@@ -119,20 +121,24 @@ class MusicBot(commands.Bot):
         before: discord.VoiceState,
         after: discord.VoiceState,
     ) -> None:
+        player = self.players.get_existing(member.guild.id)
         if self.user and member.id == self.user.id:
+            if player is None:
+                return
             if before.channel and not after.channel:
-                player = self.players.get_existing(member.guild.id)
-                if player is not None:
-                    await player.stop()
+                await player.stop()
+                return
+            if after.channel == before.channel:
+                return
+            player.sync_listeners(after.channel)
+        elif player is None or not player.update_listener(
+            member, before.channel, after.channel
+        ):
             return
 
-        player = self.players.get_existing(member.guild.id)
-        if player is None or player.voice_client is None:
-            return
-        bot_channel = player.voice_client.channel
-        if bot_channel not in (before.channel, after.channel):
+        if player.voice_client is None:
             return
-        if player.human_listeners():
+        if player.listener_count:
             player.cancel_disconnect_grace()
         else:
             player.schedule_disconnect_if_empty()
@@ -140,6 +146,43 @@ class MusicBot(commands.Bot):
     async def close(self) -> None:
         log.info("Shutting down — disconnecting all players")
         await self.players.shutdown()
+        stats = YTDLSource.metadata.stats
+        log.info(
+            "Metadata cache: %d hits, %d misses, %d stream refreshes, %d evictions",
+            stats.hits,
+            stats.misses,
+            stats.stream_refreshes,
+            stats.evictions,
+        )
+        sched = YTDLSource.scheduler.stats
+        log.info(
+            "Extraction scheduler: %d submitted, %d completed, %d cancelled, "
+            "wait avg %.2fs / max %.2fs",
+            sched.submitted,
+            sched.completed,
+            sched.cancelled,
+            sched.avg_wait,
+            sched.max_wait,
+        )
+        for name, cache in (("fragment", Embeds.fragments), ("embed", Embeds.payloads)):
+            log.info(
+                "Render %s cache: %d hits, %d misses (%.0f%%), %d evictions",
+                name,
+                cache.stats.hits,
+                cache.stats.misses,
+                cache.stats.hit_ratio * 100,
+                cache.stats.evictions,
+            )
+        if (ticker := self.players.ticker) is not None:
+            log.info(
+                "Progress ticker: %d ticks, %d edits, %d unchanged, %d declined",
+                ticker.stats.ticks,
+                ticker.stats.edits,
+                ticker.stats.unchanged,
+                ticker.stats.declined,
+            )
+        YTDLSource.metadata.close()
+        YTDLSource.scheduler.shutdown()
         await super().close()
 
 
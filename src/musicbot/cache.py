@@ -0,0 +1,393 @@
+"""Caches in front of yt-dlp: track metadata and search results."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, ClassVar
+from urllib.parse import parse_qs, urlsplit
+
+log = logging.getLogger(__name__)
+
+_YOUTUBE_ID_RE = re.compile(
+    r"""
+    ^https?://
+    (?:(?:www|m|music)\.)?
+    (?:
+        youtube\.com/(?:watch\?(?:.*&)?v=|shorts/|embed/|live/|v/)
+        |youtu\.be/
+    )
+    (?P<id>[0-9A-Za-z_-]{11})
+    (?![0-9A-Za-z_-])
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_EXPIRE_PATH_RE = re.compile(r"/expire/(\d+)(?:/|$)")
+
+
+def canonical_key(extractor: str, video_id: str) -> str:
+    """Cache key shared by URL lookups and extracted info dicts."""
+    return f"{extractor.lower()}:{video_id}"
+
+
+def youtube_id(url: str) -> str | None:
+    match = _YOUTUBE_ID_RE.match(url.strip())
+    return match.group("id") if match is not None else None
+
+
+def key_for_url(url: str) -> str | None:
+    """Derive the cache key from a URL without running yt-dlp.
+
+    Only YouTube URLs can be mapped up front; anything else returns ``None``
+    and always goes through a full extraction.
+    """
+    video_id = youtube_id(url)
+    return canonical_key("youtube", video_id) if video_id is not None else None
+
+
+def key_for_info(info: dict[str, Any]) -> str | None:
+    extractor = info.get("extractor_key") or info.get("ie_key")
+    video_id = info.get("id")
+    if not extractor or not video_id:
+        return None
+    return canonical_key(str(extractor), str(video_id))
+
+
+def stream_expiry(url: str | None) -> float | None:
+    """Return the ``expire=`` deadline embedded in a googlevideo URL, if any."""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    values = parse_qs(parts.query).get("expire")
+    raw = values[0] if values else None
+    if raw is None:
+        match = _EXPIRE_PATH_RE.search(parts.path)
+        raw = match.group(1) if match else None
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class CachedMetadata:
+    """Long-lived track metadata plus a short-lived stream URL."""
+
+    key: str
+    webpage_url: str
+    title: str
+    duration: int
+    uploader: str | None
+    thumbnail: str | None
+    stored_at: float
+    stream_url: str | None = None
+    stream_expires_at: float | None = None
+    acodec: str | None = None
+
+    def stream_valid(self, *, until: float) -> bool:
+        """True if the stream URL outlives ``until`` (epoch seconds)."""
+        if self.stream_url is None or self.stream_expires_at is None:
+            return False
+        return self.stream_expires_at > until
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stream_refreshes: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class MetadataCache:
+    """Keeps resolved track metadata keyed by canonical video ID.
+
+    Metadata (title, duration, uploader, thumbnail) is trusted for ``ttl``
+    seconds. The stream URL is only handed out while its ``expire=`` deadline
+    is at least ``stream_margin`` seconds away, or past the later deadline a
+    caller asks for — after that the caller has to re-extract and
+    :meth:`put` the fresh URL back. Entries evicted from the
+    LRU stay on disk and are promoted again on the next lookup.
+
+    The in-memory LRU is updated in place, but SQLite only ever runs on the
+    cache's own single I/O thread: stores are queued to it without waiting,
+    and :meth:`get` awaits it only on a memory miss. Having one thread keeps
+    reads ordered after the writes queued before them.
+    """
+
+    DEFAULT_STREAM_MARGIN: ClassVar[float] = 600.0
+
+    _SCHEMA: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS metadata (
+            key TEXT PRIMARY KEY,
+            webpage_url TEXT NOT NULL,
+            title TEXT NOT NULL,
+            duration INTEGER NOT NULL,
+            uploader TEXT,
+            thumbnail TEXT,
+            stored_at REAL NOT NULL,
+            stream_url TEXT,
+            stream_expires_at REAL,
+            acodec TEXT
+        )
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 2048,
+        ttl: float = 7 * 24 * 3600,
+        path: str | Path | None = None,
+        stream_margin: float = DEFAULT_STREAM_MARGIN,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stream_margin = stream_margin
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, CachedMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._io: ThreadPoolExecutor | None = None
+        if path:
+            self._db = self._open(Path(path))
+        if self._db is not None:
+            self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metadata-db")
+
+    def _open(self, path: Path) -> sqlite3.Connection | None:
+        try:
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(self._SCHEMA)
+            columns = {row[1] for row in db.execute("PRAGMA table_info(metadata)")}
+            if "acodec" not in columns:
+                db.execute("ALTER TABLE metadata ADD COLUMN acodec TEXT")
+        except sqlite3.Error:
+            log.warning("Metadata cache at %s unavailable, using memory only", path, exc_info=True)
+            return None
+        db.execute("DELETE FROM metadata WHERE stored_at < ?", (time.time() - self.ttl,))
+        return db
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stream_deadline(self, valid_until: float | None = None) -> float:
+        """Epoch time a cached stream URL has to outlive to be handed out."""
+        return max(time.time() + self.stream_margin, valid_until or 0.0)
+
+    async def get(
+        self, key: str, *, valid_until: float | None = None
+    ) -> CachedMetadata | None:
+        """Return fresh metadata for ``key``; counts a hit only if the stream is usable."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        io = self._io
+        if entry is None and io is not None:
+            try:
+                loaded = await asyncio.get_running_loop().run_in_executor(
+                    io, self._load, key
+                )
+            except RuntimeError:  # closed meanwhile
+                loaded = None
+            if loaded is not None:
+                with self._lock:
+                    # A put() while we were reading wins over the disk copy.
+                    entry = self._entries.get(key)
+                    if entry is None:
+                        entry = loaded
+                        self.stats.disk_hits += 1
+                        self._insert(entry)
+        now = time.time()
+        deadline = self.stream_deadline(valid_until)
+        with self._lock:
+            if entry is None or now - entry.stored_at > self.ttl:
+                self.stats.misses += 1
+                return None
+            if entry.stream_valid(until=deadline):
+                self.stats.hits += 1
+            else:
+                self.stats.stream_refreshes += 1
+            return entry
+
+    def put(self, entry: CachedMetadata) -> None:
+        with self._lock:
+            self._entries.pop(entry.key, None)
+            self._insert(entry)
+            self._queue_save(entry)
+
+    def update_stream(
+        self, key: str, stream_url: str, acodec: str | None = None
+    ) -> CachedMetadata | None:
+        """Swap in a freshly extracted stream URL, keeping the metadata."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry = replace(
+                entry,
+                stream_url=stream_url,
+                stream_expires_at=stream_expiry(stream_url),
+                acodec=acodec,
+            )
+            self._entries[key] = entry
+            self._queue_save(entry)
+            return entry
+
+    def close(self) -> None:
+        """Finish the queued writes and close the database."""
+        with self._lock:
+            io, self._io = self._io, None
+        if io is not None:
+            io.shutdown(wait=True)
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _queue_save(self, entry: CachedMetadata) -> None:
+        # Called with ``_lock`` held, so close() can't shut the thread down
+        # between the check and the submit.
+        if self._io is not None:
+            self._io.submit(self._save, entry)
+
+    def _insert(self, entry: CachedMetadata) -> None:
+        self._entries[entry.key] = entry
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _load(self, key: str) -> CachedMetadata | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT key, webpage_url, title, duration, uploader, thumbnail,"
+                " stored_at, stream_url, stream_expires_at, acodec FROM metadata WHERE key = ?",
+                (key,),
+            ).fetchone()
+        except sqlite3.Error:
+            log.warning("Metadata cache read failed", exc_info=True)
+            return None
+        return CachedMetadata(*row) if row else None
+
+    def _save(self, entry: CachedMetadata) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.webpage_url,
+                    entry.title,
+                    entry.duration,
+                    entry.uploader,
+                    entry.thumbnail,
+                    entry.stored_at,
+                    entry.stream_url,
+                    entry.stream_expires_at,
+                    entry.acodec,
+                ),
+            )
+        except sqlite3.Error:
+            log.warning("Metadata cache write failed", exc_info=True)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    requests: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    extractions: int = 0
+
+
+class SearchCache:
+    """Short-TTL search results with single-flight coalescing.
+
+    Identical (normalized) queries issued while an extraction is running all
+    await the same task; results are then served from memory until ``ttl``
+    expires. Failures are propagated to every waiter but never cached.
+    """
+
+    def __init__(
+        self, *, ttl: float = 300.0, max_size: int = 512, stats_size: int = 256
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.stats_size = stats_size
+        self._results: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+        self._stats: OrderedDict[str, QueryStats] = OrderedDict()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.casefold().split())
+
+    def query_stats(self) -> dict[str, QueryStats]:
+        """Per-query counters for the most recently seen queries."""
+        return dict(self._stats)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        stats = self._stats_for(key)
+        stats.requests += 1
+
+        cached = self._results.get(key)
+        if cached is not None:
+            stored_at, entries = cached
+            if time.monotonic() - stored_at <= self.ttl:
+                self._results.move_to_end(key)
+                stats.cache_hits += 1
+                return list(entries)
+            del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            stats.extractions += 1
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            stats.coalesced += 1
+        # Shield so one caller giving up does not cancel the shared extraction.
+        return list(await asyncio.shield(task))
+
+    def _finish(self, key: str, task: asyncio.Task[list[dict[str, Any]]]) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._results[key] = (time.monotonic(), task.result())
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def _stats_for(self, key: str) -> QueryStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = QueryStats()
+            while len(self._stats) > self.stats_size:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        return stats
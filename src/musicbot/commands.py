@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-from typing import TYPE_CHECKING, Any, cast
+import re
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import discord
 from discord import app_commands
@@ -12,15 +14,18 @@ from discord.ext import commands
 from yt_dlp.utils import DownloadError, YoutubeDLError
 
 from .errors import (
+    DuplicateTrackError,
     ExtractError,
+    MusicBotError,
     QueueFullError,
     SearchError,
     SearchTimeoutError,
 )
-from .music_queue import LoopMode
-from .source import YTDLSource
+from .music_queue import LoopMode, MusicQueue
+from .source import Playlist, YTDLSource
+from .track import Requester
 from .ui import Embeds, respond
-from .views import RemoveTrackView, SearchView
+from .views import QueueView, RemoveTrackView, SearchView
 
 if TYPE_CHECKING:
     from .bot import MusicBot
@@ -30,6 +35,8 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_QUERY_SEPARATOR = re.compile(r"[;\n]")
+
 _LOOP_CHOICES = [
     app_commands.Choice(name="Off", value=LoopMode.OFF.value),
     app_commands.Choice(name="Current track", value=LoopMode.TRACK.value),
@@ -37,6 +44,10 @@ _LOOP_CHOICES = [
 ]
 
 
+def _split_queries(query: str) -> list[str]:
+    return [part.strip() for part in _QUERY_SEPARATOR.split(query) if part.strip()]
+
+
 def _user_voice_channel(
     interaction: discord.Interaction,
 ) -> discord.VoiceChannel | discord.StageChannel | None:
@@ -54,6 +65,9 @@ def _user_voice_channel(
 class Music(commands.Cog):
     """Slash commands that talk to the per-guild player."""
 
+    MAX_BATCH_QUERIES: ClassVar[int] = 10
+    BATCH_CONCURRENCY: ClassVar[int] = 3
+
     def __init__(self, bot: MusicBot) -> None:
         self.bot = bot
 
@@ -91,10 +105,18 @@ class Music(commands.Cog):
         name="play",
         description="Play a track or add it to the queue",
     )
-    @app_commands.describe(query="A URL (YouTube etc.) or a search query")
+    @app_commands.describe(
+        query="A URL (YouTube etc.) or a search query; separate several with ;",
+        position="Queue position to insert at (default: the end)",
+    )
     @app_commands.guild_only()
     @app_commands.checks.cooldown(1, 3.0, key=lambda i: i.user.id)
-    async def play(self, interaction: discord.Interaction, query: str) -> None:
+    async def play(
+        self,
+        interaction: discord.Interaction,
+        query: str,
+        position: app_commands.Range[int, 1, MusicQueue.DEFAULT_MAX_SIZE] | None = None,
+    ) -> None:
         guild = interaction.guild
         if guild is None:
             return
@@ -106,30 +128,208 @@ class Music(commands.Cog):
                 "Join a voice channel to play music.",
             )
             return
+        queries = _split_queries(query)
+        if not 1 <= len(queries) <= self.MAX_BATCH_QUERIES:
+            await self._send_error(
+                interaction,
+                f"Enter between 1 and {self.MAX_BATCH_QUERIES} queries "
+                "separated by `;`.",
+            )
+            return
 
         await interaction.response.defer(thinking=True)
 
+        player = self.bot.players.get(guild)
+        async with player.request():
+            # On a cold guild, do the voice handshake while the track is resolved.
+            connecting = (
+                None if player.is_connected else player.begin_connect(voice_channel)
+            )
+            if isinstance(interaction.channel, discord.abc.Messageable):
+                player.bind_text_channel(interaction.channel)
+
+            if len(queries) > 1:
+                await self._enqueue_batch(
+                    interaction,
+                    player,
+                    voice_channel,
+                    queries,
+                    connecting=connecting,
+                    position=position,
+                )
+            elif YTDLSource.is_single_track_url(queries[0]):
+                await self._enqueue_placeholder(
+                    interaction,
+                    player,
+                    voice_channel,
+                    queries[0],
+                    connecting=connecting,
+                    position=position,
+                )
+            else:
+                await self._play_query(
+                    interaction,
+                    player,
+                    voice_channel,
+                    queries[0],
+                    connecting=connecting,
+                    position=position,
+                )
+
+    async def _play_query(
+        self,
+        interaction: discord.Interaction,
+        player: GuildPlayer,
+        voice_channel: discord.VoiceChannel | discord.StageChannel,
+        query: str,
+        *,
+        connecting: asyncio.Task[None] | None,
+        position: int | None,
+    ) -> None:
         track = await self._fetch_track(interaction, query)
         if track is None:
             return
 
-        player = self.bot.players.get(guild)
-        if isinstance(interaction.channel, discord.abc.Messageable):
-            player.bind_text_channel(interaction.channel)
+        if isinstance(track, Playlist):
+            await self._enqueue_playlist(
+                interaction,
+                player,
+                voice_channel,
+                track,
+                connecting=connecting,
+                position=position,
+            )
+            return
 
-        position = await self._enqueue_track(interaction, player, voice_channel, track)
-        if position is None:
+        added_at = await self._enqueue_track(
+            interaction,
+            player,
+            voice_channel,
+            track,
+            connecting=connecting,
+            position=position,
+        )
+        if added_at is None:
             return
 
         player.ensure_loop_running()
         await interaction.edit_original_response(
-            embed=Embeds.added(track, position, len(player.queue)),
+            embed=Embeds.added(track, added_at, len(player.queue)),
             view=RemoveTrackView(player, track),
         )
 
+    async def _enqueue_placeholder(
+        self,
+        interaction: discord.Interaction,
+        player: GuildPlayer,
+        voice_channel: discord.VoiceChannel | discord.StageChannel,
+        url: str,
+        *,
+        connecting: asyncio.Task[None] | None,
+        position: int | None,
+    ) -> None:
+        """Take a queue slot for ``url`` now and fill in its details once resolved."""
+        member = cast(discord.Member, interaction.user)
+        track = YTDLSource.placeholder(url, Requester.from_member(member))
+        try:
+            added_at = player.enqueue_placeholder(track, position=position)
+        except (QueueFullError, DuplicateTrackError) as exc:
+            await interaction.edit_original_response(
+                embed=Embeds.error(str(exc)), view=None
+            )
+            return
+        if not await self._connect(interaction, player, voice_channel, connecting):
+            player.discard_placeholder(track)
+            return
+
+        player.ensure_loop_running()
+        view = RemoveTrackView(player, track)
+        await interaction.edit_original_response(
+            embed=Embeds.added(track, added_at, len(player.queue)), view=view
+        )
+
+        if not await player.wait_resolved(track):
+            with contextlib.suppress(discord.HTTPException):
+                await interaction.edit_original_response(
+                    embed=Embeds.error(
+                        f"Couldn't load <{url}>, so it was taken off the queue."
+                    ),
+                    view=None,
+                )
+            return
+        position_now = player.queue.position_of(track)
+        if position_now is None and player.current is not track:
+            return  # removed while it was loading
+        with contextlib.suppress(discord.HTTPException):
+            await interaction.edit_original_response(
+                embed=Embeds.added(track, position_now or added_at, len(player.queue)),
+            )
+
+    async def _enqueue_batch(
+        self,
+        interaction: discord.Interaction,
+        player: GuildPlayer,
+        voice_channel: discord.VoiceChannel | discord.StageChannel,
+        queries: list[str],
+        *,
+        connecting: asyncio.Task[None] | None,
+        position: int | None,
+    ) -> None:
+        """Resolve several queries concurrently and queue them in the given order.
+
+        Each track is queued as soon as it and every query before it are done.
+        Searches take the top result instead of asking.
+        """
+        requester = Requester.from_member(cast(discord.Member, interaction.user))
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def resolve(query: str) -> Track:
+            async with semaphore:
+                return await YTDLSource.resolve_query(query, requester)
+
+        tasks = [asyncio.create_task(resolve(query)) for query in queries]
+        added: list[tuple[int, Track]] = []
+        failed: list[tuple[str, str]] = []
+        connected = False
+        try:
+            for index, (query, task) in enumerate(zip(queries, tasks, strict=True)):
+                try:
+                    track = await task
+                except MusicBotError as exc:
+                    failed.append((query, str(exc)))
+                    continue
+                except YoutubeDLError as exc:
+                    log.warning("yt-dlp error for %r: %s", query, exc)
+                    failed.append((query, "Failed to process the track."))
+                    continue
+
+                if not connected:
+                    connected = True
+                    if not await self._connect(
+                        interaction, player, voice_channel, connecting
+                    ):
+                        return
+                at = None if position is None else position + len(added)
+                try:
+                    added.append((player.enqueue(track, position=at), track))
+                except DuplicateTrackError as exc:
+                    failed.append((query, str(exc)))
+                except QueueFullError as exc:
+                    failed.extend((rest, str(exc)) for rest in queries[index:])
+                    break
+                player.ensure_loop_running()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        await interaction.edit_original_response(
+            embed=Embeds.batch_added(added, failed, len(player.queue)), view=None
+        )
+
     async def _fetch_track(
         self, interaction: discord.Interaction, query: str
-    ) -> Track | None:
+    ) -> Track | Playlist | None:
         try:
             return await self._resolve_query(interaction, query)
         except SearchTimeoutError as exc:
@@ -145,15 +345,18 @@ class Music(commands.Cog):
         await interaction.edit_original_response(embed=embed, view=None)
         return None
 
-    async def _enqueue_track(
+    async def _connect(
         self,
         interaction: discord.Interaction,
         player: GuildPlayer,
         voice_channel: discord.VoiceChannel | discord.StageChannel,
-        track: Track,
-    ) -> int | None:
+        connecting: asyncio.Task[None] | None = None,
+    ) -> bool:
         try:
-            await player.connect(voice_channel)
+            if connecting is not None:
+                await player.finish_connect(connecting)
+            else:
+                await player.connect(voice_channel)
         except discord.Forbidden:
             message = "Failed to connect: missing permissions for the voice channel."
         except TimeoutError:
@@ -168,25 +371,89 @@ class Music(commands.Cog):
             await interaction.edit_original_response(
                 embed=Embeds.error(message), view=None
             )
-            return None
+            return False
+        return True
 
+    async def _enqueue_track(
+        self,
+        interaction: discord.Interaction,
+        player: GuildPlayer,
+        voice_channel: discord.VoiceChannel | discord.StageChannel,
+        track: Track,
+        *,
+        connecting: asyncio.Task[None] | None = None,
+        position: int | None = None,
+    ) -> int | None:
+        if not await self._connect(interaction, player, voice_channel, connecting):
+            return None
         try:
-            return player.enqueue(track)
-        except QueueFullError as exc:
+            return player.enqueue(track, position=position)
+        except (QueueFullError, DuplicateTrackError) as exc:
             await interaction.edit_original_response(
                 embed=Embeds.error(str(exc)), view=None
             )
             return None
 
+    async def _enqueue_playlist(
+        self,
+        interaction: discord.Interaction,
+        player: GuildPlayer,
+        voice_channel: discord.VoiceChannel | discord.StageChannel,
+        playlist: Playlist,
+        *,
+        connecting: asyncio.Task[None] | None = None,
+        position: int | None = None,
+    ) -> None:
+        if not await self._connect(interaction, player, voice_channel, connecting):
+            return
+        added, stopped = player.enqueue_many(playlist.tracks, position=position)
+        if not added and (stopped is not None or playlist.complete):
+            message = (
+                str(stopped)
+                if stopped is not None
+                else "Every track of this playlist is already in the queue."
+            )
+            await interaction.edit_original_response(
+                embed=Embeds.error(message), view=None
+            )
+            return
+
+        player.ensure_loop_running()
+        member = cast(discord.Member, interaction.user)
+        await interaction.edit_original_response(
+            embed=Embeds.playlist_added(
+                playlist.title,
+                playlist.url,
+                added,
+                member,
+                loading=not playlist.complete and stopped is None,
+            ),
+            view=None,
+        )
+        if playlist.complete or stopped is not None:
+            return
+
+        added += await player.import_playlist(
+            YTDLSource.playlist_pages(playlist, Requester.from_member(member)),
+            position=None if position is None else position + added,
+        )
+        with contextlib.suppress(discord.HTTPException):
+            await interaction.edit_original_response(
+                embed=Embeds.playlist_added(
+                    playlist.title, playlist.url, added, member, loading=False
+                ),
+            )
+
     async def _resolve_query(
         self, interaction: discord.Interaction, query: str
-    ) -> Track:
+    ) -> Track | Playlist:
         member = cast(discord.Member, interaction.user)
+        requester = Requester.from_member(member)
 
         if YTDLSource.is_url(query):
-            return await YTDLSource.resolve_url(query, member)
+            return await YTDLSource.load_url(query, requester)
 
-        entries = await YTDLSource.search(query, limit=5)
+        entries = await YTDLSource.search(query, limit=5, guild_id=member.guild.id)
         future: asyncio.Future[dict[str, Any]] = (
             asyncio.get_running_loop().create_future()
         )
@@ -202,7 +469,7 @@ class Music(commands.Cog):
             view.stop()
             raise SearchTimeoutError("Selection timed out.") from exc
 
-        return await YTDLSource.resolve_entry(entry, member)
+        return await YTDLSource.resolve_entry(entry, requester)
 
     @app_commands.command(name="skip", description="Skip the current track")
     @app_commands.guild_only()
@@ -274,12 +541,8 @@ class Music(commands.Cog):
                 embed=Embeds.info("The queue is empty."), ephemeral=True
             )
             return
-        embed = Embeds.queue(
-            player.queue.snapshot(),
-            player.current,
-            player.queue.loop_mode,
-        )
-        await interaction.response.send_message(embed=embed)
+        view = QueueView(player)
+        await interaction.response.send_message(embed=view.render(), view=view)
 
     @app_commands.command(name="clear", description="Clear the queue")
     @app_commands.guild_only()
@@ -304,7 +567,7 @@ class Music(commands.Cog):
     async def remove(
         self,
         interaction: discord.Interaction,
-        position: app_commands.Range[int, 1, 500],
+        position: app_commands.Range[int, 1, MusicQueue.DEFAULT_MAX_SIZE],
     ) -> None:
         player = await self._require_active_player(interaction)
         if player is None:
@@ -335,21 +598,60 @@ class Music(commands.Cog):
             embed=Embeds.success(f"Track **{track.title}** removed from the queue.")
         )
 
-    @app_commands.command(name="shuffle", description="Shuffle the queue")
+    @app_commands.command(name="move", description="Move a track to another queue position")
+    @app_commands.describe(
+        source="Current track number in the queue",
+        target="New position for the track",
+    )
     @app_commands.guild_only()
-    async def shuffle(self, interaction: discord.Interaction) -> None:
+    async def move(
+        self,
+        interaction: discord.Interaction,
+        source: app_commands.Range[int, 1, MusicQueue.DEFAULT_MAX_SIZE],
+        target: app_commands.Range[int, 1, MusicQueue.DEFAULT_MAX_SIZE],
+    ) -> None:
         player = await self._require_active_player(interaction)
         if player is None:
             return
-        if len(player.queue) < 2:
-            await self._send_warning(
-                interaction, "The queue must contain at least 2 tracks."
+
+        size = len(player.queue)
+        if not (1 <= source <= size and 1 <= target <= size):
+            await self._send_error(
+                interaction, f"Positions must be in range (1..{size})."
+            )
+            return
+
+        member = cast(discord.Member, interaction.user)
+        track = player.queue.peek(source)
+        if (
+            track.requester.id != member.id
+            and not member.guild_permissions.administrator
+        ):
+            await self._send_error(
+                interaction,
+                "Only the requester or an admin can move someone else's track.",
             )
             return
-        player.queue.shuffle()
+
+        player.queue.move(source, target)
         await interaction.response.send_message(
-            embed=Embeds.success("Queue shuffled.")
+            embed=Embeds.success(f"Track **{track.title}** moved to `#{target}`.")
+        )
+
+    @app_commands.command(name="shuffle", description="Toggle shuffle mode")
+    @app_commands.guild_only()
+    async def shuffle(self, interaction: discord.Interaction) -> None:
+        player = await self._require_active_player(interaction)
+        if player is None:
+            return
+        enabled = not player.queue.shuffle_mode
+        player.queue.set_shuffle(enabled)
+        message = (
+            "Shuffle on: tracks will play in random order."
+            if enabled
+            else "Shuffle off: the queue plays in its original order again."
         )
+        await interaction.response.send_message(embed=Embeds.success(message))
 
     @app_commands.command(name="loop", description="Control loop mode")
     @app_commands.describe(mode="Loop mode (without an argument it cycles through modes)")
@@ -57,9 +57,21 @@ class Settings:
     requester_instant_skip: bool
     inactivity_timeout: int
     empty_channel_grace: int
+    prefetch_ahead: int
+    max_tracks_per_user: int
+    reject_duplicates: bool
+    live_progress_interval: int
     log_level: str
     activity_name: str
     ydl_force_ipv4: bool
+    ydl_flat_search: bool
+    extract_workers: int
+    extract_per_guild: int
+    extract_processes: bool
+    metadata_cache_path: str
+    metadata_cache_size: int
+    metadata_cache_ttl: int
+    search_cache_ttl: int
 
     @classmethod
     def load(cls) -> Settings:
@@ -77,7 +89,21 @@ class Settings:
             requester_instant_skip=_get_bool("REQUESTER_INSTANT_SKIP", True),
             inactivity_timeout=_get_int("INACTIVITY_TIMEOUT", 180, lo=10),
             empty_channel_grace=_get_int("EMPTY_CHANNEL_GRACE", 30, lo=0),
+            prefetch_ahead=_get_int("PREFETCH_AHEAD", 3, lo=0),
+            max_tracks_per_user=_get_int("MAX_TRACKS_PER_USER", 0, lo=0),
+            reject_duplicates=_get_bool("REJECT_DUPLICATES", False),
+            live_progress_interval=_get_int("LIVE_PROGRESS_INTERVAL", 0, lo=0),
             log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
             activity_name=os.getenv("ACTIVITY_NAME", "").strip(),
             ydl_force_ipv4=_get_bool("YDL_FORCE_IPV4", True),
+            ydl_flat_search=_get_bool("YDL_FLAT_SEARCH", True),
+            extract_workers=_get_int("EXTRACT_WORKERS", 4, lo=1),
+            extract_per_guild=_get_int("EXTRACT_PER_GUILD", 2, lo=1),
+            extract_processes=_get_bool("EXTRACT_PROCESSES", False),
+            metadata_cache_path=os.getenv(
+                "METADATA_CACHE_PATH", ".metadata_cache.sqlite3"
+            ).strip(),
+            metadata_cache_size=_get_int("METADATA_CACHE_SIZE", 2048, lo=1),
+            metadata_cache_ttl=_get_int("METADATA_CACHE_TTL", 7 * 24 * 3600, lo=60),
+            search_cache_ttl=_get_int("SEARCH_CACHE_TTL", 300, lo=0),
         )
@@ -21,3 +21,11 @@ class ExtractError(MusicBotError):
 
 class QueueFullError(MusicBotError):
     """Raised when the queue has reached its maximum size."""
+
+
+class QueueQuotaError(QueueFullError):
+    """Raised when a user already has the maximum number of tracks queued."""
+
+
+class DuplicateTrackError(MusicBotError):
+    """Raised when a track is already in the queue and duplicates are rejected."""
@@ -0,0 +1,188 @@
+"""Bounded yt-dlp extraction pool with per-guild fairness."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+_GLOBAL_KEY = 0
+
+
+def _init_worker_process(log_level: int) -> None:
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s [%(levelname)s] %(name)s[pid %(process)d]: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    logging.getLogger("yt_dlp").setLevel(logging.WARNING)
+
+
+@dataclass(slots=True)
+class SchedulerStats:
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    cancelled: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.started if self.started else 0.0
+
+
+@dataclass(slots=True)
+class _Job:
+    guild_key: int
+    call: Callable[[], Any]
+    future: asyncio.Future[Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ExtractionScheduler:
+    """Runs blocking extraction calls on a dedicated, bounded executor.
+
+    Jobs are queued per guild and dispatched round-robin, so a guild importing
+    a lot can only ever occupy ``per_guild`` of the ``workers`` slots while
+    everyone else keeps getting turns. Calls without a guild share one bucket.
+
+    Workers live for the lifetime of the executor, so thread-local state such
+    as ``YTDLSource._get_ydl``'s cached instances is reused. With
+    ``processes=True`` the workers are spawned processes instead of threads:
+    extraction then no longer competes for the GIL with the voice send
+    threads, at the cost of pickling arguments and results.
+    """
+
+    def __init__(
+        self, *, workers: int = 4, per_guild: int = 2, processes: bool = False
+    ) -> None:
+        self.workers = workers
+        self.per_guild = min(per_guild, workers)
+        self.processes = processes
+        self.stats = SchedulerStats()
+        self._executor: Executor | None = None
+        self._pending: OrderedDict[int, deque[_Job]] = OrderedDict()
+        self._running: Counter[int] = Counter()
+        self._running_total = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(jobs) for jobs in self._pending.values())
+
+    @property
+    def running(self) -> int:
+        return self._running_total
+
+    def guild_depth(self, guild_id: int) -> int:
+        jobs = self._pending.get(guild_id)
+        return len(jobs) if jobs else 0
+
+    def _make_executor(self) -> Executor:
+        if self.processes:
+            # Spawn rather than fork: forking a process that runs an event loop
+            # and voice threads copies their locks in whatever state they're in.
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_process,
+                initargs=(logging.getLogger().getEffectiveLevel(),),
+            )
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ytdl")
+
+    async def run[T](
+        self, guild_id: int | None, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Queue ``fn(*args, **kwargs)`` for ``guild_id`` and await its result."""
+        loop = asyncio.get_running_loop()
+        key = guild_id if guild_id is not None else _GLOBAL_KEY
+        job = _Job(key, functools.partial(fn, *args, **kwargs), loop.create_future())
+        self._pending.setdefault(key, deque()).append(job)
+        self.stats.submitted += 1
+        self._dispatch(loop)
+        return await job.future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        while self._running_total < self.workers:
+            job = self._next_job()
+            if job is None:
+                return
+            self._start(loop, job)
+
+    def _next_job(self) -> _Job | None:
+        for key in list(self._pending):
+            if self._running[key] >= self.per_guild:
+                continue
+            jobs = self._pending[key]
+            while jobs and jobs[0].future.cancelled():
+                jobs.popleft()
+                self.stats.cancelled += 1
+            if not jobs:
+                del self._pending[key]
+                continue
+            job = jobs.popleft()
+            # Rotate the guild to the back so the others get the next slots.
+            if jobs:
+                self._pending.move_to_end(key)
+            else:
+                del self._pending[key]
+            return job
+        return None
+
+    def _start(self, loop: asyncio.AbstractEventLoop, job: _Job) -> None:
+        if self._executor is None:
+            self._executor = self._make_executor()
+        wait = time.monotonic() - job.enqueued_at
+        self.stats.started += 1
+        self.stats.total_wait += wait
+        self.stats.max_wait = max(self.stats.max_wait, wait)
+        self._running[job.guild_key] += 1
+        self._running_total += 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Extraction for guild %s started after %.2fs (%d running, %d queued)",
+                job.guild_key,
+                wait,
+                self._running_total,
+                self.queue_depth,
+            )
+        inner = loop.run_in_executor(self._executor, job.call)
+        inner.add_done_callback(functools.partial(self._finish, loop, job))
+
+    def _finish(
+        self, loop: asyncio.AbstractEventLoop, job: _Job, inner: asyncio.Future[Any]
+    ) -> None:
+        self._running[job.guild_key] -= 1
+        if self._running[job.guild_key] <= 0:
+            del self._running[job.guild_key]
+        self._running_total -= 1
+        self.stats.completed += 1
+        # Retrieve the outcome even if the caller gave up, so a failure nobody
+        # awaits isn't reported as "exception was never retrieved".
+        exc = None if inner.cancelled() else inner.exception()
+        if not job.future.done():
+            if inner.cancelled():
+                job.future.cancel()
+            elif exc is not None:
+                job.future.set_exception(exc)
+            else:
+                job.future.set_result(inner.result())
+        self._dispatch(loop)
+
+    def shutdown(self) -> None:
+        for jobs in self._pending.values():
+            for job in jobs:
+                job.future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
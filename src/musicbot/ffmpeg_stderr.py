@@ -0,0 +1,156 @@
+"""One reader thread for the stderr of every ffmpeg child process."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import selectors
+import threading
+from dataclasses import dataclass
+
+_ffmpeg_log = logging.getLogger("ffmpeg")
+
+_READ_SIZE = 65536
+# ffmpeg runs with ``-loglevel level+warning``, so every line carries its level.
+_ERROR_TAG = b"[error]"
+_RECONNECT_TAG = b"Will reconnect"
+
+
+@dataclass(slots=True)
+class StderrStats:
+    errors: int = 0
+    reconnects: int = 0
+    processes: int = 0
+
+
+class StderrPipe:
+    """Write end of a pipe, handed to ffmpeg as its stderr.
+
+    It exposes a real ``fileno()`` so discord.py passes it straight to
+    ``Popen`` instead of starting its own pipe-reader thread. Call
+    :meth:`close_writer` once the process is spawned so the reader sees EOF
+    when ffmpeg exits.
+    """
+
+    def __init__(self, fd: int) -> None:
+        self._fd: int | None = fd
+
+    def fileno(self) -> int:
+        if self._fd is None:
+            raise ValueError("stderr pipe already closed")
+        return self._fd
+
+    def close_writer(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+@dataclass(slots=True)
+class _Reader:
+    guild_id: int | None
+    stats: StderrStats
+    buffer: bytearray
+
+
+class FFmpegStderrMux:
+    """Selector-based reader shared by all ffmpeg processes in the bot.
+
+    Lines are only split and decoded when the ``ffmpeg`` logger would emit
+    them at DEBUG; otherwise chunks are just scanned for error and reconnect
+    markers with ``bytes.count`` and dropped. Counters are kept per guild
+    until :meth:`forget` drops them; each reader holds its guild's counters
+    directly, so a process still running after that can't bring them back.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: list[tuple[int, _Reader]] = []
+        self._stats: dict[int | None, StderrStats] = {}
+        # Created on first use so importing the module costs no fds or threads.
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_r = self._wake_w = -1
+
+    def open(self, guild_id: int | None = None) -> StderrPipe:
+        read_fd, write_fd = os.pipe()
+        with self._lock:
+            if self._selector is None:
+                self._start()
+            stats = self._stats.setdefault(guild_id, StderrStats())
+            stats.processes += 1
+            self._pending.append((read_fd, _Reader(guild_id, stats, bytearray())))
+        os.write(self._wake_w, b"\0")
+        return StderrPipe(write_fd)
+
+    def _start(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        threading.Thread(target=self._run, name="ffmpeg-stderr", daemon=True).start()
+
+    def stats(self, guild_id: int | None) -> StderrStats:
+        with self._lock:
+            return self._stats.get(guild_id) or StderrStats()
+
+    def forget(self, guild_id: int | None) -> None:
+        """Drop ``guild_id``'s counters, e.g. once its player is gone."""
+        with self._lock:
+            self._stats.pop(guild_id, None)
+
+    def _run(self) -> None:
+        assert self._selector is not None
+        while True:
+            for key, _ in self._selector.select():
+                if key.fd == self._wake_r:
+                    os.read(self._wake_r, _READ_SIZE)
+                    self._register_pending()
+                else:
+                    self._drain(key.fd, key.data)
+
+    def _register_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        assert self._selector is not None
+        for fd, reader in pending:
+            self._selector.register(fd, selectors.EVENT_READ, reader)
+
+    def _drain(self, fd: int, reader: _Reader) -> None:
+        try:
+            data = os.read(fd, _READ_SIZE)
+        except OSError:
+            data = b""
+        if not data:
+            assert self._selector is not None
+            self._selector.unregister(fd)
+            with contextlib.suppress(OSError):
+                os.close(fd)
+            self._emit(reader, bytes(reader.buffer))
+            return
+
+        stats = reader.stats
+        stats.errors += data.count(_ERROR_TAG)
+        stats.reconnects += data.count(_RECONNECT_TAG)
+        if not _ffmpeg_log.isEnabledFor(logging.DEBUG):
+            reader.buffer.clear()
+            return
+
+        reader.buffer.extend(data)
+        end = reader.buffer.rfind(b"\n")
+        if end < 0:
+            return
+        chunk = bytes(reader.buffer[:end])
+        del reader.buffer[: end + 1]
+        self._emit(reader, chunk)
+
+    @staticmethod
+    def _emit(reader: _Reader, chunk: bytes) -> None:
+        if not chunk or not _ffmpeg_log.isEnabledFor(logging.DEBUG):
+            return
+        for line in chunk.decode(errors="ignore").splitlines():
+            text = line.rstrip()
+            if text:
+                _ffmpeg_log.debug("[guild %s] %s", reader.guild_id, text)
+
+
+stderr_mux = FFmpegStderrMux()
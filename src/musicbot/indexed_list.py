@@ -0,0 +1,269 @@
+"""Sequence with logarithmic positional operations and stable item handles."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable, Iterator
+
+
+class _Node[T]:
+    __slots__ = (
+        "handle",
+        "item",
+        "left",
+        "parent",
+        "priority",
+        "right",
+        "size",
+        "weight",
+        "weight_sum",
+    )
+
+    def __init__(self, item: T, handle: int, weight: int) -> None:
+        self.item = item
+        self.handle = handle
+        self.priority = random.random()
+        self.size = 1
+        self.weight = weight
+        self.weight_sum = weight
+        self.left: _Node[T] | None = None
+        self.right: _Node[T] | None = None
+        self.parent: _Node[T] | None = None
+
+
+def _size[T](node: _Node[T] | None) -> int:
+    return node.size if node is not None else 0
+
+
+def _weight_sum[T](node: _Node[T] | None) -> int:
+    return node.weight_sum if node is not None else 0
+
+
+def _update[T](node: _Node[T]) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+    node.weight_sum = node.weight + _weight_sum(node.left) + _weight_sum(node.right)
+    if node.left is not None:
+        node.left.parent = node
+    if node.right is not None:
+        node.right.parent = node
+
+
+def _merge[T](a: _Node[T] | None, b: _Node[T] | None) -> _Node[T] | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _split[T](
+    node: _Node[T] | None, count: int
+) -> tuple[_Node[T] | None, _Node[T] | None]:
+    """Split off the first ``count`` nodes; both returned roots are detached."""
+    if node is None:
+        return None, None
+    if _size(node.left) >= count:
+        left, right = _split(node.left, count)
+        node.left = right
+        _update(node)
+        node.parent = None
+        return left, node
+    left, right = _split(node.right, count - _size(node.left) - 1)
+    node.right = left
+    _update(node)
+    node.parent = None
+    return node, right
+
+
+class IndexedList[T]:
+    """An implicit treap: a list with O(log n) insert/remove/move by position.
+
+    Every stored item gets an integer handle on insertion. The handle stays
+    valid while the item is in the list, whatever moves around it, and maps to
+    the item's node in O(1); the node's current position is then found by
+    walking parent links, O(log n).
+
+    Items also carry a non-negative integer weight, summed per subtree, so an
+    item can be picked by cumulative weight (e.g. uniformly among the items
+    of weight 1) in O(log n).
+    """
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._root: _Node[T] | None = None
+        self._nodes: dict[int, _Node[T]] = {}
+        self._next_handle = 1
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __bool__(self) -> bool:
+        return self._root is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return self.iter_from(0)
+
+    def _set_root(self, root: _Node[T] | None) -> None:
+        if root is not None:
+            root.parent = None
+        self._root = root
+
+    def _check_index(self, index: int, *, allow_end: bool = False) -> None:
+        upper = len(self) + (1 if allow_end else 0)
+        if not 0 <= index < upper:
+            raise IndexError(f"index {index} out of range")
+
+    def _node_at(self, index: int) -> _Node[T]:
+        self._check_index(index)
+        node = self._root
+        while node is not None:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node
+            else:
+                index -= left + 1
+                node = node.right
+        raise IndexError(index)  # unreachable with consistent sizes
+
+    @property
+    def total_weight(self) -> int:
+        return _weight_sum(self._root)
+
+    def insert(self, index: int, item: T, *, weight: int = 1) -> int:
+        """Insert ``item`` before position ``index`` (0-based); returns its handle."""
+        self._check_index(index, allow_end=True)
+        handle = self._next_handle
+        self._next_handle += 1
+        node = _Node(item, handle, weight)
+        self._nodes[handle] = node
+        left, right = _split(self._root, index)
+        self._set_root(_merge(_merge(left, node), right))
+        return handle
+
+    def append(self, item: T, *, weight: int = 1) -> int:
+        return self.insert(len(self), item, weight=weight)
+
+    def pop(self, index: int) -> T:
+        self._check_index(index)
+        left, rest = _split(self._root, index)
+        node, right = _split(rest, 1)
+        assert node is not None
+        del self._nodes[node.handle]
+        self._set_root(_merge(left, right))
+        return node.item
+
+    def move(self, src: int, dst: int) -> None:
+        """Move the item at ``src`` so that it ends up at position ``dst``."""
+        self._check_index(src)
+        self._check_index(dst)
+        left, rest = _split(self._root, src)
+        node, right = _split(rest, 1)
+        assert node is not None
+        remaining = _merge(left, right)
+        left, right = _split(remaining, dst)
+        self._set_root(_merge(_merge(left, node), right))
+
+    def __getitem__(self, index: int) -> T:
+        return self._node_at(index).item
+
+    def handle_at(self, index: int) -> int:
+        return self._node_at(index).handle
+
+    def get(self, handle: int) -> T | None:
+        node = self._nodes.get(handle)
+        return node.item if node is not None else None
+
+    def index_of(self, handle: int) -> int | None:
+        node = self._nodes.get(handle)
+        if node is None:
+            return None
+        index = _size(node.left)
+        while node.parent is not None:
+            parent = node.parent
+            if node is parent.right:
+                index += _size(parent.left) + 1
+            node = parent
+        return index
+
+    def iter_from(self, start: int) -> Iterator[T]:
+        """In-order iteration starting at position ``start``."""
+        stack: list[_Node[T]] = []
+        node = self._root
+        index = start
+        while node is not None:
+            left = _size(node.left)
+            if index < left:
+                stack.append(node)
+                node = node.left
+            elif index == left:
+                stack.append(node)
+                break
+            else:
+                index -= left + 1
+                node = node.right
+        while stack:
+            node = stack.pop()
+            yield node.item
+            child = node.right
+            while child is not None:
+                stack.append(child)
+                child = child.left
+
+    def slice(self, start: int, stop: int) -> list[T]:
+        result: list[T] = []
+        if stop <= start:
+            return result
+        for item in self.iter_from(start):
+            result.append(item)
+            if len(result) >= stop - start:
+                break
+        return result
+
+    def set_weight(self, handle: int, weight: int) -> None:
+        node = self._nodes[handle]
+        node.weight = weight
+        while node is not None:
+            node.weight_sum = (
+                node.weight + _weight_sum(node.left) + _weight_sum(node.right)
+            )
+            node = node.parent
+
+    def reset_weights(self, weight: int) -> None:
+        """Give every item ``weight``, in O(n)."""
+        for node in self._nodes.values():
+            node.weight = weight
+            node.weight_sum = weight * node.size
+
+    def handle_by_weight(self, offset: int) -> int:
+        """Handle of the item whose cumulative weight range contains ``offset``.
+
+        Walking the items in order, an item of weight ``w`` covers ``w``
+        consecutive offsets starting at the total weight before it; items of
+        weight 0 are never returned.
+        """
+        if not 0 <= offset < self.total_weight:
+            raise IndexError(f"weight offset {offset} out of range")
+        node = self._root
+        while node is not None:
+            left = _weight_sum(node.left)
+            if offset < left:
+                node = node.left
+            elif offset < left + node.weight:
+                return node.handle
+            else:
+                offset -= left + node.weight
+                node = node.right
+        raise IndexError(offset)  # unreachable with consistent sums
+
+    def clear(self) -> None:
+        self._root = None
+        self._nodes.clear()
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import enum
 import random
-from collections import deque
-from collections.abc import Iterator
+import secrets
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from typing import ClassVar
 
-from .errors import QueueFullError
+from .errors import DuplicateTrackError, QueueFullError, QueueQuotaError
+from .indexed_list import IndexedList
 from .track import Track
 
 
@@ -26,10 +29,43 @@ class LoopMode(enum.Enum):
         }[self]
 
 
+@dataclass(slots=True)
+class RequesterUsage:
+    tracks: int = 0
+    duration: int = 0
+
+
+@dataclass(slots=True)
+class _Slot:
+    # As counted into the aggregates when the track was added or re-synced.
+    handle: int
+    duration: int
+    url: str
+
+
 class MusicQueue:
-    """A simple FIFO queue with helpers for management and looping."""
+    """A FIFO queue with positional editing, stable handles and looping.
+
+    Backed by an :class:`IndexedList`, so peeking, inserting, removing and
+    moving by position are O(log n). Each queued track gets a handle that
+    stays valid until the track leaves the queue.
 
-    DEFAULT_MAX_SIZE = 500
+    Total duration, per-requester usage and a ``webpage_url`` index are kept
+    up to date on every add/remove/clear, so footers, quotas
+    (``max_per_requester``) and duplicate checks (``reject_duplicates``) are
+    O(1).
+
+    In shuffle mode the stored order is left alone: :meth:`pop_next` draws a
+    random track instead of the first one, so turning shuffle off restores
+    the original order. Tracks re-queued by loop mode are held back until
+    every other track of the current round has been drawn.
+
+    ``version`` changes whenever the stored tracks, their order or their
+    counted durations change, so rendered views of the queue can be cached;
+    ``on_change`` is called right after each such change.
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
     _CYCLE_ORDER: ClassVar[tuple[LoopMode, ...]] = (
         LoopMode.OFF,
         LoopMode.TRACK,
@@ -37,9 +73,22 @@ class MusicQueue:
     )
 
     def __init__(self, *, max_size: int = DEFAULT_MAX_SIZE) -> None:
-        self._items: deque[Track] = deque()
+        self._items: IndexedList[Track] = IndexedList()
+        self._slots: dict[int, _Slot] = {}  # id(track) -> slot
+        self._total_duration = 0
+        self._usage: dict[int, RequesterUsage] = {}
+        self._urls: Counter[str] = Counter()
         self.max_size = max_size
+        self.max_per_requester = 0
+        self.reject_duplicates = False
         self.loop_mode: LoopMode = LoopMode.OFF
+        self.shuffle_mode = False
+        self._next_pick: int | None = None  # handle drawn by peek_next()
+        self.version = 0
+        self.on_change: Callable[[], None] | None = None
+        # Handles restart at 1 for every queue; the token tells apart handles
+        # from another queue instance (or process) in component custom_ids.
+        self.token = secrets.randbits(32)
 
     def __len__(self) -> int:
         return len(self._items)
@@ -53,53 +102,205 @@ class MusicQueue:
     def snapshot(self) -> list[Track]:
         return list(self._items)
 
-    def add(self, track: Track) -> int:
+    def upcoming(self, limit: int) -> list[Track]:
+        """The next ``limit`` tracks in play order, without copying the rest.
+
+        In shuffle mode only the next draw is known, so at most one track is
+        returned.
+        """
+        if self.shuffle_mode:
+            track = self.peek_next()
+            return [track] if track is not None and limit > 0 else []
+        return self._items.slice(0, limit)
+
+    def page(self, start: int, stop: int) -> list[Track]:
+        """Tracks at 0-based positions ``start:stop`` in stored order."""
+        return self._items.slice(start, stop)
+
+    def _check_position(self, position: int, *, size: int | None = None) -> None:
+        size = len(self._items) if size is None else size
+        if not 1 <= position <= size:
+            raise IndexError(f"Position {position} is out of range (1..{size}).")
+
+    def add(self, track: Track, *, requeue: bool = False) -> int:
+        return self.insert(len(self._items) + 1, track, requeue=requeue)
+
+    def insert(self, position: int, track: Track, *, requeue: bool = False) -> int:
+        """Insert ``track`` at 1-based ``position`` (clamped to the end).
+
+        ``requeue=True`` marks a finished track put back by loop mode: it skips
+        the per-requester quota and duplicate check and, in shuffle mode, is
+        not drawn again before the rest of the round.
+        """
         if len(self._items) >= self.max_size:
             raise QueueFullError(
                 f"The queue is full (maximum {self.max_size} tracks)."
             )
-        self._items.append(track)
-        return len(self._items)
+        requester_id = track.requester.id
+        if (
+            not requeue
+            and self.max_per_requester
+            and self.usage_of(requester_id).tracks >= self.max_per_requester
+        ):
+            raise QueueQuotaError(
+                f"You already have {self.max_per_requester} tracks in the queue."
+            )
+        if (
+            not requeue
+            and self.reject_duplicates
+            and self._urls.get(track.webpage_url)
+        ):
+            raise DuplicateTrackError(f"**{track.title}** is already in the queue.")
+
+        index = max(0, min(position - 1, len(self._items)))
+        handle = self._items.insert(
+            index, track, weight=0 if requeue and self.shuffle_mode else 1
+        )
+        duration = max(track.duration, 0)
+        self._slots[id(track)] = _Slot(handle, duration, track.webpage_url)
+        self._total_duration += duration
+        usage = self._usage.setdefault(requester_id, RequesterUsage())
+        usage.tracks += 1
+        usage.duration += duration
+        if track.webpage_url:
+            self._urls[track.webpage_url] += 1
+        self._changed()
+        return index + 1
 
     def pop_next(self) -> Track | None:
         if not self._items:
             return None
-        return self._items.popleft()
+        if not self.shuffle_mode:
+            return self._forget(self._items.pop(0))
+        self.peek_next()
+        assert self._next_pick is not None
+        index = self._items.index_of(self._next_pick)
+        assert index is not None
+        self._next_pick = None
+        return self._forget(self._items.pop(index))
+
+    def peek_next(self) -> Track | None:
+        """The track :meth:`pop_next` will return, drawing it now if shuffling."""
+        if not self._items:
+            return None
+        if not self.shuffle_mode:
+            return self._items[0]
+        if self._next_pick is not None:
+            track = self._items.get(self._next_pick)
+            if track is not None:
+                return track
+        if not self._items.total_weight:
+            # Everything left was re-queued this round: start the next one.
+            self._items.reset_weights(1)
+        self._next_pick = self._items.handle_by_weight(
+            random.randrange(self._items.total_weight)
+        )
+        return self._items.get(self._next_pick)
+
+    def set_shuffle(self, enabled: bool) -> None:
+        """Switch shuffle mode; turning it off plays in the stored order again."""
+        if enabled == self.shuffle_mode:
+            return
+        self.shuffle_mode = enabled
+        self._next_pick = None
+        self._items.reset_weights(1)
+        self._changed()
 
     def peek(self, position: int) -> Track:
-        if not 1 <= position <= len(self._items):
-            raise IndexError(
-                f"Position {position} is out of range (1..{len(self._items)})."
-            )
+        self._check_position(position)
         return self._items[position - 1]
 
     def position_of(self, track: Track) -> int | None:
-        for index, item in enumerate(self._items, start=1):
-            if item is track:
-                return index
-        return None
+        handle = self.handle_of(track)
+        return self.position_of_handle(handle) if handle is not None else None
+
+    def handle_of(self, track: Track) -> int | None:
+        slot = self._slots.get(id(track))
+        return slot.handle if slot is not None else None
+
+    def position_of_handle(self, handle: int) -> int | None:
+        index = self._items.index_of(handle)
+        return index + 1 if index is not None else None
+
+    def get_by_handle(self, handle: int) -> Track | None:
+        return self._items.get(handle)
 
     def remove_at(self, position: int) -> Track:
-        if not 1 <= position <= len(self._items):
-            raise IndexError(
-                f"Position {position} is out of range (1..{len(self._items)})."
-            )
-        track = self._items[position - 1]
-        del self._items[position - 1]
+        self._check_position(position)
+        return self._forget(self._items.pop(position - 1))
+
+    def move(self, src: int, dst: int) -> Track:
+        """Move the track at ``src`` to ``dst`` (both 1-based); returns it."""
+        self._check_position(src)
+        self._check_position(dst)
+        track = self._items[src - 1]
+        self._items.move(src - 1, dst - 1)
+        self._changed()
         return track
 
     def clear(self) -> int:
         count = len(self._items)
         self._items.clear()
+        self._slots.clear()
+        self._total_duration = 0
+        self._usage.clear()
+        self._urls.clear()
+        self._next_pick = None
+        self._changed()
         return count
 
-    def shuffle(self) -> None:
-        items = list(self._items)
-        random.shuffle(items)
-        self._items = deque(items)
+    def sync_track(self, track: Track) -> None:
+        """Re-count a queued track whose metadata changed after it was added."""
+        slot = self._slots.get(id(track))
+        if slot is None:
+            return
+        duration = max(track.duration, 0)
+        delta = duration - slot.duration
+        if delta:
+            slot.duration = duration
+            self._total_duration += delta
+            self._usage[track.requester.id].duration += delta
+        if track.webpage_url != slot.url:
+            self._uncount_url(slot.url)
+            slot.url = track.webpage_url
+            if slot.url:
+                self._urls[slot.url] += 1
+        self._changed()
+
+    def usage_of(self, requester_id: int) -> RequesterUsage:
+        return self._usage.get(requester_id) or RequesterUsage()
+
+    def count_url(self, webpage_url: str) -> int:
+        return self._urls.get(webpage_url, 0)
+
+    def _forget(self, track: Track) -> Track:
+        slot = self._slots.pop(id(track), None)
+        if slot is None:
+            return track
+        self._total_duration -= slot.duration
+        usage = self._usage[track.requester.id]
+        usage.tracks -= 1
+        usage.duration -= slot.duration
+        if not usage.tracks:
+            del self._usage[track.requester.id]
+        self._uncount_url(slot.url)
+        self._changed()
+        return track
+
+    def _changed(self) -> None:
+        self.version += 1
+        if self.on_change is not None:
+            self.on_change()
+
+    def _uncount_url(self, url: str) -> None:
+        if not url:
+            return
+        self._urls[url] -= 1
+        if not self._urls[url]:
+            del self._urls[url]
 
     def total_duration(self) -> int:
-        return sum(t.duration for t in self._items if t.duration > 0)
+        return self._total_duration
 
     def set_loop_mode(self, mode: LoopMode) -> None:
         self.loop_mode = mode
@@ -0,0 +1,246 @@
+"""Coalescing outbound message scheduler, one per text channel."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import ClassVar
+
+import discord
+
+log = logging.getLogger(__name__)
+
+# Pending now-playing update that only strips the controls off the message.
+_RETIRE = object()
+
+
+class _ChannelBucket:
+    """Client-side pacing for one channel's message routes.
+
+    Discord allows roughly five message creates/edits per channel every five
+    seconds; staying under that keeps us out of the HTTP client's 429 retry
+    path, where a request would sit holding its bucket lock.
+    """
+
+    def __init__(self, rate: int, per: float) -> None:
+        self.rate = rate
+        self.per = per
+        self._sent: deque[float] = deque()
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] >= self.per:
+            self._sent.popleft()
+        if len(self._sent) < self.rate:
+            return 0.0
+        return self.per - (now - self._sent[0])
+
+    def consume(self) -> None:
+        self._sent.append(time.monotonic())
+
+
+class ChannelOutbox:
+    """Serializes, merges and paces everything the player posts to a channel.
+
+    Notices (errors, "queue is empty", ...) are sent in order; those that pile
+    up while the outbox waits on its bucket go out together as one message
+    with several embeds. The now-playing message is latest-wins: an update is
+    held for :attr:`DEBOUNCE` seconds and dropped if another one replaces it
+    in the meantime, and a new track edits the existing message instead of
+    sending a fresh one unless notices have been posted below it since.
+
+    Each outbox runs its own worker task, so a channel that is being paced
+    never holds up another channel's messages.
+
+    Live progress edits are the lowest priority: they are only accepted while
+    the outbox is otherwise idle. The HTTP client sleeps through 429s on its
+    own, so an edit that takes longer than :attr:`PROGRESS_TIMEOUT` is given
+    up and treated as a rate limit, backing that channel off exponentially
+    instead of holding the worker.
+    """
+
+    DEBOUNCE: ClassVar[float] = 1.0
+    MAX_EMBEDS: ClassVar[int] = 10
+    RATE: ClassVar[int] = 5
+    PER: ClassVar[float] = 5.0
+    BACKOFF_MIN: ClassVar[float] = 30.0
+    BACKOFF_MAX: ClassVar[float] = 600.0
+    PROGRESS_TIMEOUT: ClassVar[float] = 3.0
+
+    def __init__(self, channel: discord.abc.Messageable) -> None:
+        self.channel = channel
+        self._bucket = _ChannelBucket(self.RATE, self.PER)
+        self._notices: list[discord.Embed] = []
+        self._pending: tuple[discord.Embed, discord.ui.View] | object | None = None
+        self._pending_due = 0.0
+        self._message: discord.Message | None = None
+        self._buried = False  # notices were posted below ``_message``
+        self._progress: discord.Embed | None = None
+        self._backoff = 0.0
+        self._backoff_until = 0.0
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    def notify(self, embed: discord.Embed) -> None:
+        """Queue a standalone notice."""
+        if self._closing:
+            return
+        self._notices.append(embed)
+        self._kick()
+
+    def show_now_playing(self, embed: discord.Embed, view: discord.ui.View) -> None:
+        """Replace whatever the now-playing message should show next."""
+        self._set_pending((embed, view))
+
+    def retire_now_playing(self) -> None:
+        """Strip the controls once nothing newer replaces them."""
+        self._set_pending(_RETIRE)
+
+    def show_progress(self, embed: discord.Embed) -> bool:
+        """Offer a progress edit of the now-playing message; False if declined."""
+        if (
+            self._closing
+            or self._message is None
+            or self._buried
+            or self._pending is not None
+            or self._notices
+            or time.monotonic() < self._backoff_until
+            or self._bucket.delay() > 0
+        ):
+            return False
+        self._progress = embed
+        self._kick()
+        return True
+
+    def _set_pending(self, update: tuple[discord.Embed, discord.ui.View] | object) -> None:
+        if self._closing:
+            return
+        self._progress = None
+        if self._pending is None:
+            # Keep an earlier deadline so constant skipping can't starve it.
+            self._pending_due = time.monotonic() + self.DEBOUNCE
+        self._pending = update
+        self._kick()
+
+    def _kick(self) -> None:
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="outbox"
+            )
+
+    async def close(self, timeout: float) -> None:
+        """Flush queued notices, strip the now-playing controls and stop."""
+        self._closing = True
+        self._pending = _RETIRE
+        self._pending_due = 0.0
+        self._kick()
+        task = self._task
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(task, timeout)
+        except TimeoutError:
+            log.warning("Outbox did not drain within %.0fs", timeout)
+
+    async def _run(self) -> None:
+        while True:
+            if self._notices:
+                await self._pace()
+                await self._flush_notices()
+                continue
+            if self._pending is not None:
+                delay = self._pending_due - time.monotonic()
+                if delay > 0:
+                    self._wake.clear()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._wake.wait(), delay)
+                    continue
+                await self._pace()
+                await self._flush_now_playing()
+                continue
+            if self._progress is not None:
+                await self._pace()
+                await self._flush_progress()
+                continue
+            if self._closing:
+                return
+            self._wake.clear()
+            await self._wake.wait()
+
+    async def _pace(self) -> None:
+        while (delay := self._bucket.delay()) > 0:
+            await asyncio.sleep(delay)
+        self._bucket.consume()
+
+    async def _flush_notices(self) -> None:
+        batch = self._notices[: self.MAX_EMBEDS]
+        del self._notices[: self.MAX_EMBEDS]
+        try:
+            await self.channel.send(embeds=batch)
+        except discord.HTTPException:
+            log.warning("Failed to send %d notice(s)", len(batch), exc_info=True)
+            return
+        if self._message is not None:
+            self._buried = True
+
+    async def _flush_progress(self) -> None:
+        embed, self._progress = self._progress, None
+        message = self._message
+        if embed is None or message is None or self._buried:
+            return
+        try:
+            await asyncio.wait_for(message.edit(embed=embed), self.PROGRESS_TIMEOUT)
+        except discord.NotFound:
+            self._message = None
+        except (TimeoutError, discord.RateLimited):
+            self._back_off()
+        except discord.HTTPException as exc:
+            if exc.status == 429:
+                self._back_off()
+            else:
+                log.debug("Progress edit failed", exc_info=True)
+        else:
+            self._backoff = 0.0
+
+    def _back_off(self) -> None:
+        self._backoff = min(max(self._backoff * 2, self.BACKOFF_MIN), self.BACKOFF_MAX)
+        self._backoff_until = time.monotonic() + self._backoff
+        log.info("Rate limited on progress edits, backing off %.0fs", self._backoff)
+
+    async def _flush_now_playing(self) -> None:
+        update, self._pending = self._pending, None
+        message = self._message
+        if update is _RETIRE:
+            if message is not None:
+                with contextlib.suppress(discord.HTTPException):
+                    await message.edit(view=None)
+            return
+
+        assert isinstance(update, tuple)
+        embed, view = update
+        if message is not None and not self._buried:
+            try:
+                await message.edit(embed=embed, view=view)
+                return
+            except discord.NotFound:
+                self._message = None
+            except discord.HTTPException:
+                log.warning("Failed to edit now-playing message", exc_info=True)
+                return
+        elif message is not None:
+            # Leave the buried message as history, without live controls.
+            await self._pace()
+            with contextlib.suppress(discord.HTTPException):
+                await message.edit(view=None)
+
+        try:
+            self._message = await self.channel.send(embed=embed, view=view)
+        except discord.HTTPException:
+            log.warning("Failed to send now-playing message", exc_info=True)
+            self._message = None
+        self._buried = False
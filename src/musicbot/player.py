@@ -4,20 +4,27 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import enum
 import logging
 import math
 import time
+from collections.abc import AsyncIterator, Hashable, Iterator
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, cast
 
 import discord
+from yt_dlp.utils import YoutubeDLError
 
-from .errors import QueueFullError
+from .errors import DuplicateTrackError, ExtractError, QueueFullError
+from .ffmpeg_stderr import stderr_mux
 from .music_queue import LoopMode, MusicQueue
-from .source import YTDLSource
+from .outbox import ChannelOutbox
+from .progress import ProgressTicker
+from .source import PrebufferedSource, YTDLSource
+from .timers import TimerWheel
 from .track import Track
 from .ui import Embeds
-from .views import NowPlayingView
+from .views import NowPlayingView, QueuePages
 
 if TYPE_CHECKING:
     from .bot import MusicBot
@@ -34,22 +41,54 @@ class SkipResult:
     error: bool = False
 
 
+@dataclass(slots=True)
+class _Prebuffered:
+    track: Track
+    volume: float
+    source: PrebufferedSource
+    prefill: asyncio.Future[int] | None = None  # running in a worker thread
+
+
+class Deadline(enum.Enum):
+    """Per-guild deadlines kept on :attr:`PlayerManager.timers`."""
+
+    INACTIVITY = "inactivity"
+    EMPTY_CHANNEL = "empty_channel"
+
+
 class GuildPlayer:
     """Owns voice state, queue and playback loop for a single guild."""
 
     MAX_CONSECUTIVE_FAILURES: ClassVar[int] = 3
     DISCONNECT_TIMEOUT: ClassVar[float] = 5.0
     SHUTDOWN_TIMEOUT: ClassVar[float] = 10.0
+    PREFETCH_CONCURRENCY: ClassVar[int] = 2
+    # Stream URLs that would expire within this many seconds of their expected
+    # start are re-resolved ahead of time (ffmpeg may reconnect mid-track).
+    STREAM_EXPIRY_MARGIN: ClassVar[float] = 600.0
+    # Start the next track's ffmpeg this many seconds before the current one
+    # ends, and buffer this many 20 ms frames of it.
+    PREBUFFER_LEAD: ClassVar[float] = 5.0
+    PREBUFFER_FRAMES: ClassVar[int] = 50
 
     def __init__(self, bot: MusicBot, guild: discord.Guild) -> None:
         self.bot = bot
         self.guild = guild
         self.queue = MusicQueue()
+        self.queue.on_change = self._on_queue_change
+        self.queue.max_per_requester = bot.settings.max_tracks_per_user
+        self.queue.reject_duplicates = bot.settings.reject_duplicates
+        self.queue_pages = QueuePages(self)
         self.current: Track | None = None
         self.current_started_at: float | None = None
+        self._paused_at: float | None = None
         self.text_channel: discord.abc.Messageable | None = None
-        self.now_playing_msg: discord.Message | None = None
+        self.outbox: ChannelOutbox | None = None
         self.skip_votes: set[int] = set()
+        # Human members in the bot's voice channel, kept current by
+        # MusicBot.on_voice_state_update so checks never scan the channel.
+        self._listeners: set[int] = set()
+        self._listener_channel_id: int | None = None
         self.volume: float = 1.0
 
         self._next_event = asyncio.Event()
@@ -58,13 +97,22 @@ class GuildPlayer:
         self._closing = False
         self._track_errored = False
         self._consecutive_failures = 0
-        self._empty_disconnect_task: asyncio.Task[None] | None = None
+        self._idle_expired = False
+        self._prefetch_task: asyncio.Task[None] | None = None
+        self._prefetch_again = False
+        self._prebuffer_task: asyncio.Task[None] | None = None
+        self._prebuffered: _Prebuffered | None = None
+        self._advancing = False
+        self._connect_task: asyncio.Task[None] | None = None
+        self._requests = 0  # /play invocations that may still enqueue
+        self._resolving: dict[int, asyncio.Task[bool]] = {}  # id(track) -> task
 
     @property
     def elapsed(self) -> float:
         if self.current_started_at is None:
             return 0.0
-        return max(0.0, time.monotonic() - self.current_started_at)
+        now = self._paused_at if self._paused_at is not None else time.monotonic()
+        return max(0.0, now - self.current_started_at)
 
     @property
     def voice_client(self) -> discord.VoiceClient | None:
@@ -90,13 +138,7 @@ class GuildPlayer:
 
     def is_listener(self, member: discord.Member) -> bool:
         """True if ``member`` is in the same voice channel as the bot."""
-        vc = self.voice_client
-        return bool(
-            vc
-            and member.voice
-            and member.voice.channel
-            and member.voice.channel.id == vc.channel.id
-        )
+        return member.id in self._listeners and self.voice_client is not None
 
     def is_admin_or_listener(self, member: discord.Member) -> bool:
         return member.guild_permissions.administrator or self.is_listener(member)
@@ -107,14 +149,58 @@ class GuildPlayer:
             return True
         return self.current is not None and self.current.requester.id == member.id
 
-    def human_listeners(self) -> list[discord.Member]:
-        vc = self.voice_client
-        if vc is None:
-            return []
-        return [m for m in vc.channel.members if not m.bot]
+    @property
+    def listener_count(self) -> int:
+        """Number of humans in the bot's voice channel."""
+        return len(self._listeners) if self.voice_client is not None else 0
+
+    def sync_listeners(self, channel: discord.abc.Connectable | None) -> None:
+        """Rebuild the listener index for ``channel``, the bot's voice channel.
+
+        This is the only place that walks the channel's members; it runs when
+        the bot joins or is moved.
+        """
+        if not isinstance(channel, discord.VoiceChannel | discord.StageChannel):
+            self._listener_channel_id = None
+            self._listeners.clear()
+            return
+        self._listener_channel_id = channel.id
+        self._listeners = {m.id for m in channel.members if not m.bot}
+
+    def update_listener(
+        self,
+        member: discord.Member,
+        before: discord.abc.Connectable | None,
+        after: discord.abc.Connectable | None,
+    ) -> bool:
+        """Apply one member's voice move; True if the listener set changed."""
+        channel_id = self._listener_channel_id
+        if channel_id is None or member.bot:
+            return False
+        was_in = getattr(before, "id", None) == channel_id
+        is_in = getattr(after, "id", None) == channel_id
+        if was_in == is_in:
+            return False
+        if is_in:
+            self._listeners.add(member.id)
+        else:
+            self._listeners.discard(member.id)
+        return True
 
     def bind_text_channel(self, channel: discord.abc.Messageable) -> None:
         self.text_channel = channel
+        previous = self.outbox
+        if previous is not None and getattr(previous.channel, "id", None) == getattr(
+            channel, "id", None
+        ):
+            previous.channel = channel
+            return
+        self.outbox = ChannelOutbox(channel)
+        if previous is not None:
+            self.bot.loop.create_task(
+                previous.close(self.DISCONNECT_TIMEOUT),
+                name=f"outbox-close:{self.guild.id}",
+            )
 
     async def connect(
         self, channel: discord.VoiceChannel | discord.StageChannel
@@ -123,15 +209,215 @@ class GuildPlayer:
         if vc and vc.is_connected():
             if vc.channel.id != channel.id:
                 await vc.move_to(channel)
+                self.sync_listeners(channel)
             return
         await channel.connect(self_deaf=True)
+        self.sync_listeners(channel)
 
-    def enqueue(self, track: Track) -> int:
-        """Add a track to the queue and wake the playback loop if idle."""
-        position = self.queue.add(track)
+    def begin_connect(
+        self, channel: discord.VoiceChannel | discord.StageChannel
+    ) -> asyncio.Task[None]:
+        """Start connecting in the background, e.g. while a track is extracted.
+
+        Concurrent callers share one attempt. Call it inside :meth:`request`;
+        a caller that ends up with nothing to queue just doesn't await it.
+        """
+        task = self._connect_task
+        if task is None or task.done():
+            task = self.bot.loop.create_task(
+                self.connect(channel), name=f"voice-connect:{self.guild.id}"
+            )
+            self._connect_task = task
+        return task
+
+    async def finish_connect(self, task: asyncio.Task[None]) -> None:
+        """Wait for a background connect; raises whatever the connect raised."""
+        await asyncio.shield(task)
+
+    @contextlib.asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """Keep the player alive for a command that may still enqueue.
+
+        When the last such command finishes and nothing got queued, the
+        player is stopped. A voice handshake still in flight is allowed to
+        complete first, so the disconnect is a clean one.
+        """
+        self._requests += 1
+        try:
+            yield
+        finally:
+            self._requests -= 1
+            if self._requests == 0:
+                await self._stop_if_unused()
+
+    async def _stop_if_unused(self) -> None:
+        task = self._connect_task
+        if task is not None:
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise  # our caller was cancelled, not the connect
+            except (
+                discord.ClientException,
+                discord.ConnectionClosed,
+                discord.HTTPException,
+                TimeoutError,
+            ) as exc:
+                log.warning("Voice connect failed in guild %s: %s", self.guild.id, exc)
+            if self._requests > 0:
+                return
+        idle = self._task is None or self._task.done()
+        if idle and self.current is None and not self.queue and not self._closing:
+            await self.stop()
+
+    def enqueue(self, track: Track, *, position: int | None = None) -> int:
+        """Add a track to the queue and wake the playback loop if idle.
+
+        Appends by default; ``position`` (1-based) inserts it there instead.
+        """
+        position = (
+            self.queue.add(track)
+            if position is None
+            else self.queue.insert(position, track)
+        )
+        self._shed_stream(track, position)
         self._queue_added.set()
+        self._schedule_prefetch()
         return position
 
+    def enqueue_placeholder(self, track: Track, *, position: int | None = None) -> int:
+        """Queue a placeholder track and resolve it in the background.
+
+        The slot is taken right away. If resolution fails the placeholder is
+        dropped from the queue (or skipped if it already came up), which does
+        not count as a playback failure.
+        """
+        position = self.enqueue(track, position=position)
+        self._resolving[id(track)] = self.bot.loop.create_task(
+            self._resolve_placeholder(track), name=f"resolve:{self.guild.id}"
+        )
+        return position
+
+    async def wait_resolved(self, track: Track) -> bool:
+        """Wait for ``track``'s background resolution; True if it has metadata."""
+        task = self._resolving.get(id(track))
+        if task is not None:
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # Only the resolution being cancelled is an answer; our own
+                # caller being cancelled has to propagate.
+                if not task.cancelled():
+                    raise
+        return not track.placeholder
+
+    def discard_placeholder(self, track: Track) -> None:
+        task = self._resolving.pop(id(track), None)
+        if task is not None:
+            task.cancel()
+        position = self.queue.position_of(track)
+        if position is not None:
+            self.queue.remove_at(position)
+
+    async def _resolve_placeholder(self, track: Track) -> bool:
+        try:
+            resolved = await YTDLSource.resolve_url(track.webpage_url, track.requester)
+        except (ExtractError, YoutubeDLError) as exc:
+            log.warning("Failed to resolve %s: %s", track.webpage_url, exc)
+            self._drop_placeholder(track)
+            return False
+        except Exception:
+            # Anything else (a broken process pool, OSError, odd info dicts)
+            # must not reach the playback loop through wait_resolved().
+            log.exception("Unexpected error resolving %s", track.webpage_url)
+            self._send(
+                Embeds.warning(
+                    f"Couldn't load <{track.webpage_url}>, so it was taken off the queue."
+                )
+            )
+            self._drop_placeholder(track)
+            return False
+        finally:
+            self._resolving.pop(id(track), None)
+        track.fill_from(resolved)
+        self.queue.sync_track(track)
+        self._schedule_prefetch()
+        return True
+
+    def _drop_placeholder(self, track: Track) -> None:
+        position = self.queue.position_of(track)
+        if position is not None:
+            self.queue.remove_at(position)
+
+    def _shed_stream(self, track: Track, position: int) -> None:
+        """Drop the stream URL of a track queued beyond the prefetch window.
+
+        It would likely expire before the track's turn anyway; prefetch
+        re-resolves it (normally from the metadata cache) once it gets close.
+        """
+        ahead = self.bot.settings.prefetch_ahead
+        if ahead and position > ahead + 1:
+            track.drop_stream()
+
+    def enqueue_many(
+        self, tracks: list[Track], *, position: int | None = None
+    ) -> tuple[int, QueueFullError | None]:
+        """Add tracks until the queue (or the requester's quota) is full.
+
+        Appends by default; ``position`` (1-based) inserts the batch there in
+        order instead. Duplicates rejected by the queue are skipped. Returns
+        how many tracks were added and the error that stopped the batch early,
+        if any.
+        """
+        added = 0
+        stopped: QueueFullError | None = None
+        for track in tracks:
+            try:
+                if position is None:
+                    self.queue.add(track)
+                else:
+                    self.queue.insert(position + added, track)
+            except DuplicateTrackError:
+                continue
+            except QueueFullError as exc:
+                stopped = exc
+                break
+            added += 1
+        if added:
+            self._queue_added.set()
+            self._schedule_prefetch()
+        return added, stopped
+
+    async def import_playlist(
+        self, pages: AsyncIterator[list[Track]], *, position: int | None = None
+    ) -> int:
+        """Enqueue playlist pages as they arrive; returns how many tracks were added.
+
+        With ``position`` each page goes in right after the tracks already
+        imported from there. Stops at the end of the playlist, when the queue
+        fills up, when the player shuts down or on the first page that fails
+        to load.
+        """
+        added = 0
+        try:
+            async for batch in pages:
+                if self._closing:
+                    break
+                count, stopped = self.enqueue_many(
+                    batch, position=None if position is None else position + added
+                )
+                added += count
+                if stopped is not None:
+                    break
+        except (ExtractError, YoutubeDLError) as exc:
+            log.warning("Playlist import stopped in guild %s: %s", self.guild.id, exc)
+        finally:
+            aclose = getattr(pages, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        return added
+
     def ensure_loop_running(self) -> None:
         if self._task is None or self._task.done():
             self._task = self.bot.loop.create_task(
@@ -147,28 +433,81 @@ class GuildPlayer:
         if grace <= 0:
             self.bot.loop.create_task(self.stop(), name=f"empty-stop:{self.guild.id}")
             return
-        if self._empty_disconnect_task and not self._empty_disconnect_task.done():
-            return
-        self._empty_disconnect_task = self.bot.loop.create_task(
-            self._disconnect_after_grace(grace),
-            name=f"empty-disconnect:{self.guild.id}",
-        )
+        key = (self.guild.id, Deadline.EMPTY_CHANNEL)
+        if key not in self.bot.players.timers:
+            self.bot.players.timers.arm(key, grace)
 
     def cancel_disconnect_grace(self) -> None:
-        task = self._empty_disconnect_task
-        if task and not task.done():
-            task.cancel()
-        self._empty_disconnect_task = None
+        self.bot.players.timers.cancel((self.guild.id, Deadline.EMPTY_CHANNEL))
+
+    def on_deadline(self, deadline: Deadline) -> None:
+        """Called by :class:`PlayerManager` when one of our deadlines passes."""
+        if deadline is Deadline.INACTIVITY:
+            self._idle_expired = True
+            self._queue_added.set()
+        elif deadline is Deadline.EMPTY_CHANNEL:
+            if self._closing or self.listener_count:
+                return
+            log.info("Voice channel empty after grace, leaving guild %s", self.guild.id)
+            self.bot.loop.create_task(self.stop(), name=f"empty-stop:{self.guild.id}")
 
-    async def _disconnect_after_grace(self, grace: int) -> None:
-        try:
-            await asyncio.sleep(grace)
-        except asyncio.CancelledError:
+    def _schedule_prefetch(self) -> None:
+        """Refresh stream URLs of the next few tracks in the background."""
+        if self._closing or self.bot.settings.prefetch_ahead <= 0:
             return
-        if self._closing or self.human_listeners():
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_again = True
             return
-        log.info("Voice channel empty after grace, leaving guild %s", self.guild.id)
-        await self.stop()
+        self._prefetch_task = self.bot.loop.create_task(
+            self._prefetch_upcoming(), name=f"prefetch:{self.guild.id}"
+        )
+
+    async def _prefetch_upcoming(self) -> None:
+        semaphore = asyncio.Semaphore(self.PREFETCH_CONCURRENCY)
+
+        async def refresh(track: Track, valid_until: float) -> None:
+            async with semaphore:
+                await self._refresh_track(track, valid_until)
+
+        while not self._closing:
+            self._prefetch_again = False
+            # Estimate when each upcoming track starts so a URL that is still
+            # valid now but dies before its turn gets refreshed as well.
+            starts_at = time.time()
+            if self.current is not None and self.current.duration > 0:
+                starts_at += max(0.0, self.current.duration - self.elapsed)
+            stale: list[tuple[Track, float]] = []
+            for track in self.queue.upcoming(self.bot.settings.prefetch_ahead):
+                if track.placeholder:
+                    # Being resolved already; its duration is unknown too.
+                    continue
+                valid_until = starts_at + self.STREAM_EXPIRY_MARGIN
+                if track.needs_stream(valid_until):
+                    stale.append((track, valid_until))
+                starts_at += max(track.duration, 0)
+            if stale:
+                results = await asyncio.gather(
+                    *(refresh(t, until) for t, until in stale), return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        log.error("Prefetch failed in guild %s", self.guild.id, exc_info=result)
+            if not self._prefetch_again:
+                return
+
+    async def _refresh_track(self, track: Track, valid_until: float) -> bool:
+        try:
+            await YTDLSource.refresh_stream(track, valid_until=valid_until)
+        except (ExtractError, YoutubeDLError) as exc:
+            log.warning("Failed to refresh stream URL for %s: %s", track.title, exc)
+            return False
+        except Exception:
+            # OSError, a broken process pool, ...: prefetch has to keep going.
+            log.exception("Unexpected error refreshing stream URL for %s", track.title)
+            return False
+        if self.queue.handle_of(track) is not None:  # may have left the queue meanwhile
+            self.queue.sync_track(track)
+        return True
 
     async def _playback_loop(self) -> None:
         try:
@@ -176,8 +515,11 @@ class GuildPlayer:
                 track = await self._next_track()
                 if track is None:
                     if not self._closing:
-                        await self._send(Embeds.info("Queue is empty, disconnecting."))
+                        self._send(Embeds.info("Queue is empty, disconnecting."))
                     return
+                if track.placeholder and not await self.wait_resolved(track):
+                    # Already reported to the requester; not a playback failure.
+                    continue
                 await self._play_one(track)
         except Exception:
             log.exception("Playback loop crashed for guild %s", self.guild.id)
@@ -194,7 +536,7 @@ class GuildPlayer:
             if errored:
                 self._consecutive_failures += 1
                 if self._consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
-                    await self._send(
+                    self._send(
                         Embeds.error(
                             "Too many consecutive errors, stopping playback."
                         )
@@ -207,28 +549,31 @@ class GuildPlayer:
                     return previous
                 if self.queue.loop_mode is LoopMode.QUEUE:
                     try:
-                        self.queue.add(previous)
+                        position = self.queue.add(previous, requeue=True)
+                        self._shed_stream(previous, position)
                     except QueueFullError as exc:
-                        await self._send(Embeds.warning(str(exc)))
+                        self._send(Embeds.warning(str(exc)))
 
         if self.queue:
-            return self.queue.pop_next()
+            return self._pop_next()
 
-        timeout = self.bot.settings.inactivity_timeout
+        key = (self.guild.id, Deadline.INACTIVITY)
+        self._idle_expired = False
+        self.bot.players.timers.arm(key, self.bot.settings.inactivity_timeout)
         try:
-            await asyncio.wait_for(self._wait_for_track(), timeout=timeout)
-        except TimeoutError:
-            return None
-        if self._closing:
+            await self._wait_for_track()
+        finally:
+            self.bot.players.timers.cancel(key)
+        if self._closing or not self.queue:
             return None
-        return self.queue.pop_next()
+        return self._pop_next()
 
     async def _wait_for_track(self) -> None:
         # Event-driven wait: cleared before each check to avoid a race where
         # a set() between the queue check and wait() would otherwise be lost.
-        while not self.queue and not self._closing:
+        while not self.queue and not self._closing and not self._idle_expired:
             self._queue_added.clear()
-            if self.queue or self._closing:
+            if self.queue or self._closing or self._idle_expired:
                 return
             await self._queue_added.wait()
 
@@ -242,7 +587,7 @@ class GuildPlayer:
         if vc is None or not vc.is_connected():
             log.warning("Voice client gone before playback for guild %s", self.guild.id)
             self._track_errored = True
-            await self._send(
+            self._send(
                 Embeds.error(
                     f"Failed to play **{track.title}**: "
                     "the bot is not in a voice channel."
@@ -250,29 +595,154 @@ class GuildPlayer:
             )
             return
 
-        try:
-            source = YTDLSource.make_audio_source(track, volume=self.volume)
-        except Exception:
-            log.exception("Failed to build audio source for %s", track.title)
-            self._track_errored = True
-            await self._send(Embeds.error(f"Failed to play **{track.title}**."))
-            return
+        source = self._take_prebuffered(track)
+        if source is None:
+            valid_until = time.time() + self.STREAM_EXPIRY_MARGIN
+            if track.needs_stream(valid_until):
+                await self._refresh_track(track, valid_until)
+            try:
+                source = YTDLSource.make_audio_source(
+                    track, volume=self.volume, guild_id=self.guild.id
+                )
+            except Exception:
+                log.exception("Failed to build audio source for %s", track.title)
+                self._track_errored = True
+                self._send(Embeds.error(f"Failed to play **{track.title}**."))
+                return
 
         try:
             vc.play(source, after=self._after_play)
         except discord.ClientException:
             log.exception("voice_client.play failed for guild %s", self.guild.id)
+            source.cleanup()
             self._track_errored = True
-            await self._send(Embeds.error(f"Failed to start **{track.title}**."))
+            self._send(Embeds.error(f"Failed to start **{track.title}**."))
             return
 
         self.current_started_at = time.monotonic()
-        await self._send_now_playing(track)
+        self._paused_at = None
+        self._schedule_prefetch()
+        self._schedule_prebuffer(track)
+        self._send_now_playing(track)
 
         try:
             await self._next_event.wait()
         finally:
-            await self._cleanup_now_playing_view()
+            self._cancel_prebuffer_task()
+            # Superseded (and never sent) if the next track starts promptly.
+            if self.outbox is not None:
+                self.outbox.retire_now_playing()
+
+    def _pop_next(self) -> Track | None:
+        # The prebuffered track leaving the queue to be played is not a
+        # change that should discard it.
+        self._advancing = True
+        try:
+            return self.queue.pop_next()
+        finally:
+            self._advancing = False
+
+    def _on_queue_change(self) -> None:
+        prepared = self._prebuffered
+        if prepared is None or self._advancing:
+            return
+        if self.current is not None:
+            upcoming = self._upcoming_track(self.current)
+        else:
+            upcoming = self.queue.peek_next()
+        if upcoming is not prepared.track:
+            self._discard_prebuffered()
+
+    def _upcoming_track(self, playing: Track) -> Track | None:
+        if self.queue.loop_mode is LoopMode.TRACK:
+            return playing
+        return self.queue.peek_next()
+
+    def _schedule_prebuffer(self, playing: Track) -> None:
+        if playing.duration <= 0:
+            return
+        self._prebuffer_task = self.bot.loop.create_task(
+            self._prebuffer_next(playing), name=f"prebuffer:{self.guild.id}"
+        )
+
+    async def _prebuffer_next(self, playing: Track) -> None:
+        # Re-check after each sleep: pauses push the end of the track back.
+        while (remaining := playing.duration - self.elapsed) > self.PREBUFFER_LEAD:
+            await asyncio.sleep(remaining - self.PREBUFFER_LEAD)
+        track = self._upcoming_track(playing)
+        if track is None or self._closing:
+            return
+        if track.placeholder and not await self.wait_resolved(track):
+            return
+        valid_until = time.time() + self.STREAM_EXPIRY_MARGIN
+        if track.needs_stream(valid_until):
+            await self._refresh_track(track, valid_until)
+        if self._closing or self._upcoming_track(playing) is not track:
+            return  # the queue changed while the stream was refreshed
+        volume = self.volume
+        try:
+            source = PrebufferedSource(
+                YTDLSource.make_audio_source(track, volume=volume, guild_id=self.guild.id)
+            )
+        except Exception:
+            log.debug("Prebuffering %s failed", track.title, exc_info=True)
+            return
+        self._discard_prebuffered()
+        prepared = _Prebuffered(track, volume, source)
+        prepared.prefill = asyncio.ensure_future(
+            asyncio.to_thread(source.prefill, self.PREBUFFER_FRAMES)
+        )
+        self._prebuffered = prepared
+        try:
+            # Shielded: cancelling this task can't stop the worker thread.
+            await asyncio.shield(prepared.prefill)
+        except Exception:
+            log.debug("Prefill of %s failed", track.title, exc_info=True)
+            if self._prebuffered is prepared:
+                self._discard_prebuffered()
+
+    def _take_prebuffered(self, track: Track) -> PrebufferedSource | None:
+        """Hand out the prebuffered source if it is still for ``track``.
+
+        Anything else — the queue changed, the track was removed, the volume
+        moved so the passthrough/PCM choice differs, or the prefill is still
+        running — tears it down.
+        """
+        prepared = self._prebuffered
+        if prepared is None:
+            return None
+        if (
+            prepared.track is track
+            and prepared.volume == self.volume
+            and prepared.source.ready
+        ):
+            self._prebuffered = None
+            return prepared.source
+        self._discard_prebuffered()
+        return None
+
+    def _discard_prebuffered(self) -> None:
+        """Drop the prebuffered source, once its prefill thread is done with it."""
+        prepared, self._prebuffered = self._prebuffered, None
+        if prepared is None:
+            return
+        prefill = prepared.prefill
+        if prefill is None or prefill.done():
+            prepared.source.cleanup()
+            return
+
+        def cleanup(future: asyncio.Future[int]) -> None:
+            if not future.cancelled():
+                future.exception()  # mark retrieved; a failed prefill is moot now
+            prepared.source.cleanup()
+
+        prefill.add_done_callback(cleanup)
+
+    def _cancel_prebuffer_task(self) -> None:
+        task = self._prebuffer_task
+        if task and not task.done():
+            task.cancel()
+        self._prebuffer_task = None
 
     def _after_play(self, error: Exception | None) -> None:
         if error:
@@ -281,34 +751,25 @@ class GuildPlayer:
         with contextlib.suppress(RuntimeError):
             self.bot.loop.call_soon_threadsafe(self._next_event.set)
 
-    async def _send_now_playing(self, track: Track) -> None:
-        if self.text_channel is None:
+    def _send_now_playing(self, track: Track) -> None:
+        if self.outbox is None:
             return
-        embed = Embeds.now_playing(track, self.queue.loop_mode)
-        view = NowPlayingView(self)
-        try:
-            self.now_playing_msg = await self.text_channel.send(embed=embed, view=view)
-        except discord.HTTPException:
-            log.warning("Failed to send now-playing message", exc_info=True)
-            self.now_playing_msg = None
+        loop_mode = self.queue.loop_mode
+        if self.bot.players.ticker is not None:
+            embed = Embeds.progress(track, 0.0, loop_mode)
+        else:
+            embed = Embeds.now_playing(track, loop_mode)
+        self.outbox.show_now_playing(embed, NowPlayingView(self))
 
-    async def _cleanup_now_playing_view(self) -> None:
-        if self.now_playing_msg is None:
-            return
-        with contextlib.suppress(discord.HTTPException):
-            await self.now_playing_msg.edit(view=None)
-        self.now_playing_msg = None
-
-    async def _send(self, embed: discord.Embed) -> None:
-        if self.text_channel is None:
-            return
-        with contextlib.suppress(discord.HTTPException):
-            await self.text_channel.send(embed=embed)
+    def _send(self, embed: discord.Embed) -> None:
+        if self.outbox is not None:
+            self.outbox.notify(embed)
 
     def pause(self) -> bool:
         vc = self.voice_client
         if vc and vc.is_playing():
             vc.pause()
+            self._paused_at = time.monotonic()
             return True
         return False
 
@@ -316,6 +777,9 @@ class GuildPlayer:
         vc = self.voice_client
         if vc and vc.is_paused():
             vc.resume()
+            if self._paused_at is not None and self.current_started_at is not None:
+                self.current_started_at += time.monotonic() - self._paused_at
+            self._paused_at = None
             return True
         return False
 
@@ -331,16 +795,61 @@ class GuildPlayer:
         self.volume = clamped
         vc = self.voice_client
         source = vc.source if vc else None
+        if isinstance(source, PrebufferedSource):
+            source = source.original
         if isinstance(source, discord.PCMVolumeTransformer):
             source.volume = self.volume
+        elif vc is not None and source is not None and source.is_opus():
+            self._switch_to_pcm(vc, source)
         return self.volume
 
+    def _switch_to_pcm(self, vc: discord.VoiceClient, source: discord.AudioSource) -> None:
+        """Swap an Opus passthrough source for a PCM one so gain can be applied.
+
+        The new ffmpeg seeks to the current position; the voice client's
+        player re-checks ``is_opus()`` per packet, so it switches to encoding
+        on the fly. ``VoiceClient.play()`` only builds the Opus encoder when
+        the first source is PCM, so a track that started in passthrough gets
+        one here first.
+        """
+        if self.current is None:
+            return
+        if vc.encoder is discord.utils.MISSING:
+            try:
+                vc.encoder = discord.opus.Encoder()
+            except discord.DiscordException:
+                log.exception("Can't encode audio, keeping passthrough playback")
+                return
+        try:
+            replacement = YTDLSource.make_audio_source(
+                self.current,
+                volume=self.volume,
+                start=self.elapsed,
+                guild_id=self.guild.id,
+            )
+        except Exception:
+            log.exception("Failed to switch to PCM playback for %s", self.current.title)
+            return
+        was_paused = vc.is_paused()
+        try:
+            vc.source = replacement
+        except (TypeError, ValueError):
+            replacement.cleanup()
+            return
+        if was_paused:
+            vc.pause()
+        # The audio thread may still be inside the old source's read(); killing
+        # its ffmpeg now would look like end-of-track, so clean up a bit later.
+        self.bot.loop.call_later(1.0, source.cleanup)
+
     async def stop(self) -> None:
         """Clear queue, stop playback and disconnect from voice."""
         if self._closing:
             return
         self._closing = True
         self.cancel_disconnect_grace()
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
         self.queue.clear()
         self._queue_added.set()
         self._next_event.set()
@@ -381,8 +890,7 @@ class GuildPlayer:
             await self.skip()
             return SkipResult(skipped=True, message=instant_message)
 
-        listeners = self.human_listeners()
-        total = max(1, len(listeners))
+        total = max(1, self.listener_count)
         needed = max(1, math.ceil(total * settings.skip_vote_ratio))
 
         if member.id in self.skip_votes:
@@ -420,7 +928,13 @@ class GuildPlayer:
         return None
 
     async def _teardown(self) -> None:
-        await self._cleanup_now_playing_view()
+        for task in self._resolving.values():
+            task.cancel()
+        self._resolving.clear()
+        self._cancel_prebuffer_task()
+        self._discard_prebuffered()
+        if self.outbox is not None:
+            await self.outbox.close(self.DISCONNECT_TIMEOUT)
         vc = self.voice_client
         if vc and vc.is_connected():
             try:
@@ -435,6 +949,7 @@ class GuildPlayer:
                     await vc.disconnect(force=True)
         self.current = None
         self.current_started_at = None
+        self.sync_listeners(None)
         self.bot.players.remove(self.guild.id)
 
 
@@ -444,12 +959,20 @@ class PlayerManager:
     def __init__(self, bot: MusicBot) -> None:
         self.bot = bot
         self._players: dict[int, GuildPlayer] = {}
+        self.timers = TimerWheel(self._on_deadline)
+        interval = bot.settings.live_progress_interval
+        self.ticker = ProgressTicker(self, interval) if interval > 0 else None
+
+    def __iter__(self) -> Iterator[GuildPlayer]:
+        return iter(list(self._players.values()))
 
     def get(self, guild: discord.Guild) -> GuildPlayer:
         player = self._players.get(guild.id)
         if player is None:
             player = GuildPlayer(self.bot, guild)
             self._players[guild.id] = player
+            if self.ticker is not None:
+                self.ticker.ensure_running()
         return player
 
     def get_existing(self, guild_id: int) -> GuildPlayer | None:
@@ -457,8 +980,19 @@ class PlayerManager:
 
     def remove(self, guild_id: int) -> None:
         self._players.pop(guild_id, None)
+        for deadline in Deadline:
+            self.timers.cancel((guild_id, deadline))
+        stderr_mux.forget(guild_id)
+
+    def _on_deadline(self, key: Hashable) -> None:
+        guild_id, deadline = cast(tuple[int, Deadline], key)
+        player = self._players.get(guild_id)
+        if player is not None:
+            player.on_deadline(deadline)
 
     async def shutdown(self) -> None:
+        if self.ticker is not None:
+            await self.ticker.stop()
         results = await asyncio.gather(
             *(player.stop() for player in list(self._players.values())),
             return_exceptions=True,
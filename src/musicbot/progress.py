@@ -0,0 +1,98 @@
+"""Shared ticker that keeps now-playing progress bars live."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+from .music_queue import LoopMode
+from .ui import Embeds, progress_bar
+
+if TYPE_CHECKING:
+    from .player import GuildPlayer
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TickerStats:
+    ticks: int = 0
+    edits: int = 0
+    unchanged: int = 0
+    declined: int = 0
+
+
+class ProgressTicker:
+    """One task for every guild's live progress bar.
+
+    Each tick renders the bar of every playing guild and hands the changed
+    ones to their channel outboxes in one pass; the outboxes then send the
+    edits concurrently, paced per channel. A guild whose bar looks the same
+    as the last one sent is skipped, and an outbox that is busy or backing
+    off after a 429 declines the edit until a later tick.
+    """
+
+    MIN_INTERVAL: ClassVar[float] = 10.0
+
+    def __init__(self, players: Iterable[GuildPlayer], interval: float) -> None:
+        self.players = players
+        self.interval = max(interval, self.MIN_INTERVAL)
+        self.stats = TickerStats()
+        self._shown: dict[int, tuple[int, str, LoopMode]] = {}  # guild id -> key
+        self._task: asyncio.Task[None] | None = None
+
+    def ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="progress-ticker"
+            )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                if not self.tick():
+                    return
+            except Exception:
+                log.exception("Progress tick failed")
+
+    def tick(self) -> bool:
+        """Offer one round of edits; False once there are no players left."""
+        self.stats.ticks += 1
+        seen: set[int] = set()
+        for player in self.players:
+            seen.add(player.guild.id)
+            track = player.current
+            outbox = player.outbox
+            if track is None or outbox is None or player.is_paused:
+                continue
+            elapsed = player.elapsed
+            loop_mode = player.queue.loop_mode
+            key = (id(track), progress_bar(elapsed, track.duration), loop_mode)
+            shown = self._shown.get(player.guild.id)
+            if shown is None or shown[0] != key[0]:
+                # A new track's now-playing message went out with an empty bar.
+                shown = (key[0], progress_bar(0, track.duration), loop_mode)
+            if shown == key:
+                self.stats.unchanged += 1
+                continue
+            if not outbox.show_progress(Embeds.progress(track, elapsed, loop_mode)):
+                self.stats.declined += 1
+                continue
+            self._shown[player.guild.id] = key
+            self.stats.edits += 1
+        for guild_id in self._shown.keys() - seen:
+            del self._shown[guild_id]
+        return bool(seen)
@@ -2,26 +2,64 @@
 
 from __future__ import annotations
 
-import asyncio
+import itertools
 import logging
 import re
 import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
 from typing import IO, TYPE_CHECKING, Any, ClassVar, cast
 
 import discord
 import yt_dlp
-
+from yt_dlp.utils import DownloadError, YoutubeDLError
+
+from .cache import (
+    CachedMetadata,
+    MetadataCache,
+    SearchCache,
+    key_for_info,
+    key_for_url,
+    stream_expiry,
+    youtube_id,
+)
 from .errors import ExtractError, SearchError
-from .track import Track
+from .extraction import ExtractionScheduler
+from .ffmpeg_stderr import stderr_mux
+from .track import Requester, Stream, Track
 
 if TYPE_CHECKING:
     from .config import Settings
 
 
 _UNKNOWN = "Unknown"
+# Fields kept from extraction results; enough to list, cache and play a
+# track. Everything else (formats, thumbnails list, subtitles, player
+# responses…) is dropped right after extraction, before the info dict is
+# cached, handed to the UI or sent back from a worker process.
+_COMPACT_KEYS = (
+    "_type",
+    "id",
+    "ie_key",
+    "extractor_key",
+    "title",
+    "duration",
+    "uploader",
+    "channel",
+    "thumbnail",
+    "url",
+    "webpage_url",
+    "original_url",
+    "is_live",
+    "acodec",
+    "ext",
+)
+# Titles yt-dlp gives flat playlist entries that can never be played.
+_UNAVAILABLE_TITLES = frozenset({"[Private video]", "[Deleted video]"})
 _thread_local = threading.local()
 _yt_dlp_log = logging.getLogger("yt_dlp")
-_ffmpeg_log = logging.getLogger("ffmpeg")
 
 
 class _YDLLogger:
@@ -49,46 +87,126 @@ class _YDLLogger:
 _YDL_LOGGER = _YDLLogger()
 
 
-class _FFmpegStderrSink:
-    """File-like sink that routes ffmpeg's stderr through Python logging.
+def entry_title(entry: dict[str, Any]) -> str:
+    return entry.get("title") or _UNKNOWN
 
-    Without this, ffmpeg inherits the parent process's stderr and noisy
-    non-fatal lines (e.g. ``[opus @ ...] Error parsing Opus packet header``
-    when a stream packet is malformed but recovery succeeds) get mixed into
-    our logs. We omit ``fileno()`` on purpose so discord.py picks the
-    pipe-reader thread path and feeds bytes to ``write()``.
-    """
 
-    def __init__(self) -> None:
-        self._buffer = bytearray()
+def entry_uploader(entry: dict[str, Any]) -> str:
+    return entry.get("uploader") or entry.get("channel") or _UNKNOWN
 
-    def write(self, data: bytes) -> int:
-        self._buffer.extend(data)
-        while True:
-            idx = self._buffer.find(b"\n")
-            if idx < 0:
-                break
-            line = bytes(self._buffer[:idx])
-            del self._buffer[: idx + 1]
-            text = line.decode(errors="ignore").rstrip()
-            if text:
-                _ffmpeg_log.debug(text)
-        return len(data)
 
-    def close(self) -> None:
-        if self._buffer:
-            text = bytes(self._buffer).decode(errors="ignore").rstrip()
-            if text:
-                _ffmpeg_log.debug(text)
-            self._buffer.clear()
+@dataclass(slots=True)
+class Playlist:
+    """First page of a playlist; further pages come from :meth:`YTDLSource.playlist_pages`."""
 
+    url: str
+    title: str
+    tracks: list[Track]
+    complete: bool
 
-def entry_title(entry: dict[str, Any]) -> str:
-    return entry.get("title") or _UNKNOWN
 
+class _PlaylistCursor:
+    """Lazy flat listing of one playlist, read a page at a time.
 
-def entry_uploader(entry: dict[str, Any]) -> str:
-    return entry.get("uploader") or entry.get("channel") or _UNKNOWN
+    The entry iterator fetches further pages from the site as it is advanced,
+    so the whole import walks the playlist once. Blocking: :meth:`take` runs
+    on an extraction worker, one call at a time. The cursor owns its
+    ``YoutubeDL`` because the iterator outlives the worker call that made it.
+    """
+
+    def __init__(self, url: str, options: dict[str, Any], skip: int) -> None:
+        self.url = url
+        self._options = options
+        self._skip = skip
+        self._entries: Iterator[Any] | None = None
+
+    def take(self, count: int) -> list[dict[str, Any]]:
+        if self._entries is None:
+            ydl = yt_dlp.YoutubeDL(cast("Any", self._options))
+            info = ydl.extract_info(self.url, download=False, process=False)
+            entries = (info or {}).get("entries") or []
+            self._entries = itertools.islice(iter(entries), self._skip, None)
+        return [
+            compact_info(dict(entry))
+            for entry in itertools.islice(self._entries, count)
+            if entry
+        ]
+
+
+class PrebufferedSource(discord.AudioSource):
+    """Wraps a source and reads its first frames ahead of playback.
+
+    Built a few seconds before the current track ends so ffmpeg has already
+    connected to the CDN and produced audio by the time the voice client
+    switches over.
+    """
+
+    def __init__(self, original: discord.AudioSource) -> None:
+        self.original = original
+        self.ready = False
+        self._frames: deque[bytes] = deque()
+
+    def prefill(self, frames: int) -> int:
+        """Blocking: buffer up to ``frames`` 20 ms frames; returns how many.
+
+        Must finish before the source is handed to a voice client; ``ready``
+        tells whether it has.
+        """
+        for _ in range(frames):
+            data = self.original.read()
+            if not data:
+                break
+            self._frames.append(data)
+        self.ready = True
+        return len(self._frames)
+
+    def read(self) -> bytes:
+        if self._frames:
+            return self._frames.popleft()
+        return self.original.read()
+
+    def is_opus(self) -> bool:
+        return self.original.is_opus()
+
+    def cleanup(self) -> None:
+        self._frames.clear()
+        self.original.cleanup()
+
+
+def compact_info(info: dict[str, Any]) -> dict[str, Any]:
+    """Strip an info dict (and its playlist entries) down to ``_COMPACT_KEYS``."""
+    compact = {k: info[k] for k in _COMPACT_KEYS if k in info}
+    if "entries" in info:
+        compact["entries"] = [compact_info(e) for e in (info["entries"] or []) if e]
+    return compact
+
+
+def _extract_in_worker(
+    options: dict[str, Any],
+    generation: int,
+    target: str,
+    *,
+    lenient: bool,
+    flat: bool,
+    items: str | None,
+) -> dict[str, Any] | None:
+    """Process-pool entry point for :meth:`YTDLSource._extract`.
+
+    Worker processes never see ``configure()``, so the parent ships its
+    options with every job and the worker adopts them whenever the
+    generation changes; ``_get_ydl`` then rebuilds its warm instances.
+    yt-dlp exceptions carry tracebacks that don't pickle, so they are
+    re-raised as plain copies of the same type family.
+    """
+    if YTDLSource._options_generation != generation:
+        YTDLSource.YTDL_OPTIONS = options
+        YTDLSource._options_generation = generation
+    try:
+        return YTDLSource._extract(target, lenient=lenient, flat=flat, items=items)
+    except DownloadError as exc:
+        raise DownloadError(str(exc)) from None
+    except YoutubeDLError as exc:
+        raise YoutubeDLError(str(exc)) from None
 
 
 class YTDLSource:
@@ -109,11 +227,19 @@ class YTDLSource:
     }
 
     _options_generation: ClassVar[int] = 0
+    metadata: ClassVar[MetadataCache] = MetadataCache()
+    search_cache: ClassVar[SearchCache] = SearchCache()
+    flat_search: ClassVar[bool] = True
+    scheduler: ClassVar[ExtractionScheduler] = ExtractionScheduler()
 
     FFMPEG_BEFORE_OPTIONS: ClassVar[str] = (
         "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -nostdin"
     )
-    FFMPEG_OPTIONS: ClassVar[str] = "-vn -loglevel warning"
+    # level+ prefixes each stderr line with its level, which is what lets the
+    # stderr multiplexer count errors without parsing lines.
+    FFMPEG_OPTIONS: ClassVar[str] = "-vn -loglevel level+warning"
+
+    PLAYLIST_PAGE_SIZE: ClassVar[int] = 50
 
     _URL_RE: ClassVar[re.Pattern[str]] = re.compile(r"^https?://", re.IGNORECASE)
 
@@ -125,52 +251,151 @@ class YTDLSource:
         else:
             cls.YTDL_OPTIONS.pop("source_address", None)
         cls._options_generation += 1
+        cls.metadata.close()
+        cls.metadata = MetadataCache(
+            max_size=settings.metadata_cache_size,
+            ttl=settings.metadata_cache_ttl,
+            path=settings.metadata_cache_path or None,
+        )
+        cls.search_cache = SearchCache(ttl=settings.search_cache_ttl)
+        cls.flat_search = settings.ydl_flat_search
+        cls.scheduler.shutdown()
+        cls.scheduler = ExtractionScheduler(
+            workers=settings.extract_workers,
+            per_guild=settings.extract_per_guild,
+            processes=settings.extract_processes,
+        )
 
     @classmethod
     def is_url(cls, query: str) -> bool:
         return bool(cls._URL_RE.match(query.strip()))
 
     @classmethod
-    def _get_ydl(cls, *, lenient: bool = False) -> yt_dlp.YoutubeDL:
+    def _options(cls, *, lenient: bool, flat: bool) -> dict[str, Any]:
+        opts = dict(cls.YTDL_OPTIONS)
+        if lenient:
+            opts["ignoreerrors"] = True
+        if flat:
+            opts["extract_flat"] = "in_playlist"
+        return opts
+
+    @classmethod
+    def _get_ydl(cls, *, lenient: bool = False, flat: bool = False) -> yt_dlp.YoutubeDL:
         attr = "ydl_lenient" if lenient else "ydl_strict"
+        if flat:
+            attr += "_flat"
         gen_attr = f"{attr}_gen"
         cached = getattr(_thread_local, attr, None)
         cached_gen = getattr(_thread_local, gen_attr, -1)
         if cached is None or cached_gen != cls._options_generation:
-            opts = dict(cls.YTDL_OPTIONS)
-            if lenient:
-                opts["ignoreerrors"] = True
-            cached = yt_dlp.YoutubeDL(cast("Any", opts))
+            cached = yt_dlp.YoutubeDL(cast("Any", cls._options(lenient=lenient, flat=flat)))
             setattr(_thread_local, attr, cached)
             setattr(_thread_local, gen_attr, cls._options_generation)
         return cached
 
     @classmethod
-    def _extract(cls, target: str, *, lenient: bool = False) -> dict[str, Any] | None:
-        info = cls._get_ydl(lenient=lenient).extract_info(target, download=False)
-        return cast("dict[str, Any] | None", info)
+    def _extract(
+        cls,
+        target: str,
+        *,
+        lenient: bool = False,
+        flat: bool = False,
+        items: str | None = None,
+    ) -> dict[str, Any] | None:
+        ydl = cls._get_ydl(lenient=lenient, flat=flat)
+        if items is None:
+            info = ydl.extract_info(target, download=False)
+        else:
+            # The instance is thread-local, so narrowing it for one call is safe.
+            ydl.params["playlist_items"] = items
+            try:
+                info = ydl.extract_info(target, download=False)
+            finally:
+                ydl.params.pop("playlist_items", None)
+        if info is None:
+            return None
+        return compact_info(cast(dict[str, Any], info))
+
+    @classmethod
+    async def _run_extract(
+        cls,
+        guild_id: int | None,
+        target: str,
+        *,
+        lenient: bool = False,
+        flat: bool = False,
+        items: str | None = None,
+    ) -> dict[str, Any] | None:
+        if cls.scheduler.processes:
+            return await cls.scheduler.run(
+                guild_id,
+                _extract_in_worker,
+                dict(cls.YTDL_OPTIONS),
+                cls._options_generation,
+                target,
+                lenient=lenient,
+                flat=flat,
+                items=items,
+            )
+        return await cls.scheduler.run(
+            guild_id, cls._extract, target, lenient=lenient, flat=flat, items=items
+        )
 
     @classmethod
-    async def search(cls, query: str, *, limit: int = 5) -> list[dict[str, Any]]:
+    async def search(
+        cls, query: str, *, limit: int = 5, guild_id: int | None = None
+    ) -> list[dict[str, Any]]:
         """Search for tracks; returns up to ``limit`` usable entries.
 
         Skips unavailable videos so a single bad result doesn't kill the search.
+        Concurrent identical queries share one extraction, and results are
+        cached briefly (see :class:`SearchCache`).
+
+        In flat mode (the default) only the search listing is fetched: entries
+        carry title/duration/uploader and a page URL, and the full extraction
+        happens in :meth:`resolve_entry` for the one entry the user picks.
         """
-        info = await asyncio.to_thread(
-            cls._extract, f"ytsearch{limit}:{query}", lenient=True
+        flat = cls.flat_search
+        key = f"{'flat' if flat else 'full'}:{limit}:{SearchCache.normalize(query)}"
+        return await cls.search_cache.get_or_fetch(
+            key, lambda: cls._search_uncached(query, limit, flat=flat, guild_id=guild_id)
+        )
+
+    @classmethod
+    async def _search_uncached(
+        cls, query: str, limit: int, *, flat: bool, guild_id: int | None
+    ) -> list[dict[str, Any]]:
+        info = await cls._run_extract(
+            guild_id, f"ytsearch{limit}:{query}", lenient=True, flat=flat
         )
         if info is None:
             raise SearchError(f"No results found for `{query}`.")
-        entries = cast(
-            list[dict[str, Any]], [e for e in (info.get("entries") or []) if e]
-        )
+        entries = [
+            cast(dict[str, Any], e) for e in (info.get("entries") or []) if e
+        ]
         if not entries:
             raise SearchError(f"No results found for `{query}`.")
+        for entry in entries:
+            cls._remember(entry)
         return entries
 
     @classmethod
-    async def resolve_url(cls, url: str, requester: discord.Member) -> Track:
-        info = await asyncio.to_thread(cls._extract, url)
+    async def resolve_url(
+        cls, url: str, requester: Requester, *, valid_until: float | None = None
+    ) -> Track:
+        """Resolve a page URL, reusing cached metadata and stream URLs when possible.
+
+        A cached entry whose stream URL is about to expire (or expires before
+        ``valid_until``, epoch seconds) still saves us the metadata; only the
+        stream URL is taken from the fresh extraction.
+        """
+        key = key_for_url(url)
+        deadline = cls.metadata.stream_deadline(valid_until)
+        cached = await cls.metadata.get(key, valid_until=valid_until) if key else None
+        if cached is not None and cached.stream_valid(until=deadline):
+            return cls._track_from_cache(cached, requester)
+
+        info = await cls._run_extract(requester.guild_id, url)
         if info is None:
             raise ExtractError("Failed to retrieve track information.")
         if info.get("_type") == "playlist":
@@ -178,11 +403,105 @@ class YTDLSource:
             if not entries:
                 raise ExtractError("Playlist is empty or contains only private tracks.")
             info = entries[0]
-        return cls._build_track(cast(dict[str, Any], info), requester)
+        info = cast(dict[str, Any], info)
+        if cached is not None and info.get("url"):
+            refreshed = cls.metadata.update_stream(
+                cached.key, info["url"], info.get("acodec")
+            )
+            if refreshed is not None:
+                return cls._track_from_cache(refreshed, requester)
+        cls._remember(info)
+        return cls._build_track(info, requester)
+
+    @staticmethod
+    def is_single_track_url(url: str) -> bool:
+        """True for URLs known to name one video without extracting them."""
+        return key_for_url(url) is not None
+
+    @staticmethod
+    def placeholder(url: str, requester: Requester) -> Track:
+        """A queue entry for ``url`` to hold its slot until it is resolved."""
+        video_id = youtube_id(url)
+        page_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else url
+        return Track(
+            webpage_url=page_url,
+            title=page_url,
+            duration=0,
+            thumbnail_url=None,
+            uploader=None,
+            requester=requester,
+            placeholder=True,
+        )
+
+    @classmethod
+    async def load_url(cls, url: str, requester: Requester) -> Track | Playlist:
+        """Resolve a URL that may point at a playlist.
+
+        Playlists are listed flat, one page at a time: the returned
+        :class:`Playlist` holds only the first page of unresolved tracks, whose
+        stream URLs the player fills in as they near the head of the queue.
+        Plain video URLs go through :meth:`resolve_url` and its cache.
+        """
+        if key_for_url(url) is not None:
+            return await cls.resolve_url(url, requester)
+        info = await cls._run_extract(
+            requester.guild_id, url, flat=True, items=f"1-{cls.PLAYLIST_PAGE_SIZE}"
+        )
+        if info is None:
+            raise ExtractError("Failed to retrieve track information.")
+        if info.get("_type") != "playlist":
+            cls._remember(info)
+            return cls._build_track(info, requester)
+        entries = info.get("entries") or []
+        tracks = cls._pending_tracks(entries, requester)
+        if not tracks:
+            raise ExtractError("Playlist is empty or contains only private tracks.")
+        return Playlist(
+            url=url,
+            title=entry_title(info),
+            tracks=tracks,
+            complete=len(entries) < cls.PLAYLIST_PAGE_SIZE,
+        )
+
+    @classmethod
+    async def playlist_pages(
+        cls, playlist: Playlist, requester: Requester
+    ) -> AsyncIterator[list[Track]]:
+        """Yield the remaining pages of ``playlist`` as unresolved tracks.
+
+        The rest of the playlist is listed in one pass rather than one
+        extraction per page, which would re-walk the site's continuation
+        chain from the start every time. With thread workers the listing is
+        lazy and each page is its own scheduler job; a worker process can't
+        hand back an iterator, so there the remainder is listed in a single
+        job and sliced into pages here.
+        """
+        if playlist.complete:
+            return
+        page = cls.PLAYLIST_PAGE_SIZE
+        if cls.scheduler.processes:
+            info = await cls._run_extract(
+                requester.guild_id, playlist.url, flat=True, items=f"{page + 1}:"
+            )
+            entries = (info or {}).get("entries") or []
+            for start in range(0, len(entries), page):
+                yield cls._pending_tracks(entries[start : start + page], requester)
+            return
+
+        cursor = _PlaylistCursor(
+            playlist.url, cls._options(lenient=True, flat=True), skip=page
+        )
+        while True:
+            entries = await cls.scheduler.run(requester.guild_id, cursor.take, page)
+            if not entries:
+                return
+            yield cls._pending_tracks(entries, requester)
+            if len(entries) < page:
+                return
 
     @classmethod
     async def resolve_entry(
-        cls, entry: dict[str, Any], requester: discord.Member
+        cls, entry: dict[str, Any], requester: Requester
     ) -> Track:
         """Resolve a (possibly flat) search entry to a fully populated Track."""
         if entry.get("url") and entry.get("_type") not in ("url", "url_transparent"):
@@ -192,31 +511,147 @@ class YTDLSource:
             raise ExtractError("Failed to determine the track URL.")
         return await cls.resolve_url(page_url, requester)
 
+    @classmethod
+    async def resolve_query(cls, query: str, requester: Requester) -> Track:
+        """Resolve a URL, or the top search result, without asking the user."""
+        if cls.is_url(query):
+            return await cls.resolve_url(query, requester)
+        entries = await cls.search(query, limit=1, guild_id=requester.guild_id)
+        return await cls.resolve_entry(entries[0], requester)
+
+    @classmethod
+    async def refresh_stream(cls, track: Track, *, valid_until: float | None = None) -> None:
+        """Re-resolve ``track``'s stream URL in place, keeping its metadata.
+
+        A cached stream URL is only reused if it is still valid at
+        ``valid_until`` (epoch seconds).
+        """
+        if not track.webpage_url:
+            raise ExtractError("Track has no page URL to re-resolve.")
+        fresh = await cls.resolve_url(
+            track.webpage_url, track.requester, valid_until=valid_until
+        )
+        track.stream = fresh.stream
+        # Flat playlist entries may lack some metadata; take the full values.
+        track.title = fresh.title
+        track.duration = fresh.duration
+        track.thumbnail_url = fresh.thumbnail_url or track.thumbnail_url
+        track.uploader = fresh.uploader or track.uploader
+
     @classmethod
     def make_audio_source(
-        cls, track: Track, *, volume: float = 1.0
+        cls,
+        track: Track,
+        *,
+        volume: float = 1.0,
+        start: float = 0.0,
+        guild_id: int | None = None,
     ) -> discord.AudioSource:
-        return discord.PCMVolumeTransformer(
-            discord.FFmpegPCMAudio(
-                track.stream_url,
-                before_options=cls.FFMPEG_BEFORE_OPTIONS,
-                options=cls.FFMPEG_OPTIONS,
-                stderr=cast("IO[bytes]", _FFmpegStderrSink()),
-            ),
-            volume=volume,
+        """Build an ffmpeg-backed source for ``track``, starting at ``start`` seconds.
+
+        Opus streams played at unity gain are remuxed with ``-c:a copy`` and
+        sent as-is: no decode, no per-frame volume scaling in Python and no
+        libopus re-encode. Anything needing gain goes through the PCM path.
+        """
+        if track.stream_url is None:
+            raise ExtractError("Track has not been resolved yet.")
+        before_options = cls.FFMPEG_BEFORE_OPTIONS
+        if start > 0:
+            before_options = f"{before_options} -ss {start:.2f}"
+        pipe = stderr_mux.open(guild_id)
+        stderr = cast("IO[bytes]", pipe)
+        try:
+            if track.is_opus and volume == 1.0:
+                # Our -loglevel comes after FFmpegOpusAudio's own and wins.
+                return discord.FFmpegOpusAudio(
+                    track.stream_url,
+                    codec="copy",
+                    before_options=before_options,
+                    options=cls.FFMPEG_OPTIONS,
+                    stderr=stderr,
+                )
+            return discord.PCMVolumeTransformer(
+                discord.FFmpegPCMAudio(
+                    track.stream_url,
+                    before_options=before_options,
+                    options=cls.FFMPEG_OPTIONS,
+                    stderr=stderr,
+                ),
+                volume=volume,
+            )
+        finally:
+            # ffmpeg holds its own copy now; ours would keep the pipe from
+            # ever reaching EOF.
+            pipe.close_writer()
+
+    @classmethod
+    def _remember(cls, info: dict[str, Any]) -> None:
+        if info.get("_type") in ("url", "url_transparent"):
+            return
+        key = key_for_info(info)
+        stream_url = info.get("url")
+        if key is None or not stream_url or info.get("is_live"):
+            return
+        cls.metadata.put(
+            CachedMetadata(
+                key=key,
+                webpage_url=info.get("webpage_url") or info.get("original_url") or "",
+                title=entry_title(info),
+                duration=int(info.get("duration") or 0),
+                uploader=info.get("uploader") or info.get("channel"),
+                thumbnail=info.get("thumbnail"),
+                stored_at=time.time(),
+                stream_url=stream_url,
+                stream_expires_at=stream_expiry(stream_url),
+                acodec=info.get("acodec"),
+            )
+        )
+
+    @staticmethod
+    def _track_from_cache(entry: CachedMetadata, requester: Requester) -> Track:
+        assert entry.stream_url is not None
+        return Track(
+            webpage_url=entry.webpage_url,
+            title=entry.title,
+            duration=entry.duration,
+            thumbnail_url=entry.thumbnail,
+            uploader=entry.uploader,
+            requester=requester,
+            stream=Stream(entry.stream_url, entry.stream_expires_at, entry.acodec),
         )
 
     @staticmethod
-    def _build_track(info: dict[str, Any], requester: discord.Member) -> Track:
+    def _pending_tracks(
+        entries: list[dict[str, Any]], requester: Requester
+    ) -> list[Track]:
+        tracks: list[Track] = []
+        for entry in entries:
+            page_url = entry.get("webpage_url") or entry.get("url")
+            if not page_url or entry.get("title") in _UNAVAILABLE_TITLES:
+                continue
+            tracks.append(
+                Track(
+                    webpage_url=page_url,
+                    title=entry_title(entry),
+                    duration=int(entry.get("duration") or 0),
+                    thumbnail_url=entry.get("thumbnail"),
+                    uploader=entry.get("uploader") or entry.get("channel"),
+                    requester=requester,
+                )
+            )
+        return tracks
+
+    @staticmethod
+    def _build_track(info: dict[str, Any], requester: Requester) -> Track:
         stream_url = info.get("url")
         if not stream_url:
             raise ExtractError("Source did not return a direct audio URL.")
         return Track(
-            stream_url=stream_url,
             webpage_url=info.get("webpage_url") or info.get("original_url") or "",
             title=entry_title(info),
             duration=int(info.get("duration") or 0),
-            thumbnail=info.get("thumbnail"),
+            thumbnail_url=info.get("thumbnail"),
             uploader=info.get("uploader") or info.get("channel"),
             requester=requester,
+            stream=Stream(stream_url, stream_expiry(stream_url), info.get("acodec")),
         )
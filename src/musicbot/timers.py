@@ -0,0 +1,142 @@
+"""Hierarchical timer wheel for coarse, frequently re-armed deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections.abc import Callable, Hashable
+from typing import ClassVar
+
+log = logging.getLogger(__name__)
+
+
+class _Timer:
+    __slots__ = ("deadline", "key", "slot")
+
+    def __init__(self, key: Hashable, deadline: int) -> None:
+        self.key = key
+        self.deadline = deadline
+        self.slot: dict[Hashable, _Timer] | None = None
+
+
+class TimerWheel:
+    """Deadlines keyed by any hashable, armed and cancelled in O(1).
+
+    Time advances in ticks of :attr:`RESOLUTION` seconds. Level 0 has one
+    slot per tick for the next :attr:`SLOTS` ticks; each higher level has one
+    slot per span of the level below, so three levels of 64 cover about three
+    days at one-second ticks. Whenever a span starts, its slot one level up
+    is cascaded down; deadlines beyond the top level park in its last slot
+    and are re-placed each time they come around.
+
+    A single task drives the wheel while anything is armed, and every expiry
+    goes to the one ``on_expire`` callback with the timer's key. Arming a key
+    that is already armed moves its deadline.
+    """
+
+    RESOLUTION: ClassVar[float] = 1.0
+    BITS: ClassVar[int] = 6
+    SLOTS: ClassVar[int] = 1 << BITS
+    LEVELS: ClassVar[int] = 3
+
+    def __init__(self, on_expire: Callable[[Hashable], None]) -> None:
+        self.on_expire = on_expire
+        self._levels: list[list[dict[Hashable, _Timer]]] = [
+            [{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)
+        ]
+        self._timers: dict[Hashable, _Timer] = {}
+        self._tick = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def _now_tick(self) -> int:
+        return int(asyncio.get_running_loop().time() / self.RESOLUTION)
+
+    def arm(self, key: Hashable, delay: float) -> None:
+        """Call ``on_expire(key)`` in ``delay`` seconds (rounded up to a tick)."""
+        now = asyncio.get_running_loop().time()
+        if not self._timers:
+            # Nothing is due, so jump the wheel straight to the present.
+            self._tick = int(now / self.RESOLUTION)
+        self.cancel(key)
+        deadline = max(self._tick + 1, math.ceil((now + delay) / self.RESOLUTION))
+        timer = _Timer(key, deadline)
+        self._timers[key] = timer
+        self._place(timer)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="timer-wheel"
+            )
+
+    def cancel(self, key: Hashable) -> bool:
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        if timer.slot is not None:
+            del timer.slot[key]
+            timer.slot = None
+        return True
+
+    def _place(self, timer: _Timer) -> None:
+        now = self._tick
+        if timer.deadline - now < self.SLOTS:
+            level, index = 0, timer.deadline
+        else:
+            level, index = self.LEVELS - 1, (now >> (self.BITS * (self.LEVELS - 1))) - 1
+            for candidate in range(1, self.LEVELS):
+                shift = self.BITS * candidate
+                if (timer.deadline >> shift) - (now >> shift) < self.SLOTS:
+                    level, index = candidate, timer.deadline >> shift
+                    break
+        slot = self._levels[level][index & (self.SLOTS - 1)]
+        slot[timer.key] = timer
+        timer.slot = slot
+
+    def _cascade(self, level: int) -> None:
+        index = (self._tick >> (self.BITS * level)) & (self.SLOTS - 1)
+        slot = self._levels[level][index]
+        if not slot:
+            return
+        self._levels[level][index] = {}
+        for timer in slot.values():
+            self._place(timer)
+
+    def _step(self) -> None:
+        self._tick += 1
+        tick = self._tick
+        # Highest level first: its timers may land in a lower slot that is
+        # cascading on this same tick.
+        for level in range(self.LEVELS - 1, 0, -1):
+            if tick & ((1 << (self.BITS * level)) - 1) == 0:
+                self._cascade(level)
+        index = tick & (self.SLOTS - 1)
+        due = self._levels[0][index]
+        if not due:
+            return
+        self._levels[0][index] = {}
+        for key, timer in due.items():
+            timer.slot = None
+            del self._timers[key]
+        for key in due:
+            try:
+                self.on_expire(key)
+            except Exception:
+                log.exception("Timer callback failed for %r", key)
+
+    async def _run(self) -> None:
+        while self._timers:
+            target = self._tick + 1
+            delay = target * self.RESOLUTION - asyncio.get_running_loop().time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Catch up on ticks missed while the loop was busy.
+            now = self._now_tick()
+            while self._timers and self._tick < now:
+                self._step()
+            self._tick = max(self._tick, now)
@@ -2,23 +2,117 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 import discord
 
+from .cache import youtube_id
+
+_YOUTUBE_THUMBNAIL = "https://i.ytimg.com/vi/{}/hqdefault.jpg"
+
+
+@dataclass(frozen=True, slots=True)
+class Requester:
+    """Who queued a track, without holding on to the live ``discord.Member``.
+
+    One instance is shared by every track of a request (e.g. a playlist).
+    Embeds show it as a mention, so no display name is kept.
+    """
+
+    id: int
+    guild_id: int
+
+    @classmethod
+    def from_member(cls, member: discord.Member) -> Requester:
+        return cls(member.id, member.guild.id)
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+
+@dataclass(slots=True)
+class Stream:
+    """A resolved, expiring media URL for a track."""
+
+    url: str
+    expires_at: float | None = None
+    acodec: str | None = None
+
 
 @dataclass(slots=True)
 class Track:
-    """A resolved, playable track."""
+    """A playable track.
+
+    ``stream`` is ``None`` for tracks queued from a flat playlist listing, or
+    after :meth:`drop_stream`; the player resolves it shortly before the
+    track's turn. YouTube thumbnails are derived from the video ID instead of
+    being stored.
+
+    A ``placeholder`` track holds a queue slot for a URL whose metadata is
+    still being extracted; :meth:`fill_from` turns it into the real track.
+    """
 
-    stream_url: str
     webpage_url: str
     title: str
     duration: int
-    thumbnail: str | None
+    thumbnail_url: str | None
     uploader: str | None
-    requester: discord.Member
+    requester: Requester
+    stream: Stream | None = None
+    placeholder: bool = False
+
+    def __post_init__(self) -> None:
+        self._normalize()
+
+    def _normalize(self) -> None:
+        if self.uploader is not None:
+            self.uploader = sys.intern(self.uploader)
+        if self.thumbnail_url is not None and youtube_id(self.webpage_url) is not None:
+            self.thumbnail_url = None
+
+    @property
+    def thumbnail(self) -> str | None:
+        video_id = youtube_id(self.webpage_url)
+        if video_id is not None:
+            return _YOUTUBE_THUMBNAIL.format(video_id)
+        return self.thumbnail_url
+
+    @property
+    def stream_url(self) -> str | None:
+        return self.stream.url if self.stream is not None else None
 
     @property
     def is_live(self) -> bool:
         return self.duration <= 0
+
+    @property
+    def is_opus(self) -> bool:
+        return self.stream is not None and self.stream.acodec == "opus"
+
+    @property
+    def is_resolved(self) -> bool:
+        return self.stream is not None
+
+    def fill_from(self, resolved: Track) -> None:
+        """Take over ``resolved``'s metadata and stream, keeping the requester."""
+        self.webpage_url = resolved.webpage_url
+        self.title = resolved.title
+        self.duration = resolved.duration
+        self.thumbnail_url = resolved.thumbnail_url
+        self.uploader = resolved.uploader
+        self.stream = resolved.stream
+        self.placeholder = False
+        self._normalize()
+
+    def drop_stream(self) -> None:
+        """Forget the stream URL; it is re-resolved before the track plays."""
+        if not self.is_live:
+            self.stream = None
+
+    def needs_stream(self, deadline: float) -> bool:
+        """True if there is no stream URL or it expires before ``deadline`` (epoch)."""
+        if self.stream is None:
+            return True
+        return self.stream.expires_at is not None and self.stream.expires_at <= deadline
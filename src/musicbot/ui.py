@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import ClassVar
+
 import discord
 
 from .music_queue import LoopMode
@@ -87,6 +92,77 @@ def _apply_footer(embed: discord.Embed, suffix: str | None = None) -> discord.Em
     return embed
 
 
+@dataclass(slots=True)
+class RenderStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class RenderCache[V]:
+    """Bounded LRU of rendered text fragments or embeds."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.stats = RenderStats()
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_render(self, key: Hashable, render: Callable[[], V]) -> V:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+        self.stats.misses += 1
+        value = render()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class _TrackText:
+    heading: str  # "### [title](url)"
+    duration: str
+    line: str  # queue line without the position prefix
+
+
+def _track_key(track: Track) -> tuple[object, ...]:
+    # Everything the fragments depend on: a refresh that fills in a flat
+    # playlist entry's title or duration yields a new key.
+    return (
+        track.webpage_url,
+        track.title,
+        track.duration,
+        track.uploader,
+        track.thumbnail_url,
+        track.requester.id,
+        track.placeholder,
+    )
+
+
+def _render_track_text(track: Track) -> _TrackText:
+    duration = Emoji.HOURGLASS if track.placeholder else format_duration(track.duration)
+    return _TrackText(
+        heading=f"### [{_truncate(track.title, 100)}]({track.webpage_url})",
+        duration=duration,
+        line=(
+            f"**[{_truncate(track.title, 60)}]({track.webpage_url})** • "
+            f"`{duration}` • {track.requester.mention}"
+        ),
+    )
+
+
 async def respond(
     interaction: discord.Interaction,
     embed: discord.Embed,
@@ -104,13 +180,38 @@ async def respond(
 
 
 class Embeds:
-    """Factory of styled :class:`discord.Embed` instances."""
+    """Factory of styled :class:`discord.Embed` instances.
 
-    @staticmethod
-    def now_playing(track: Track, loop_mode: LoopMode = LoopMode.OFF) -> discord.Embed:
+    Per-track text (headings, durations, queue lines) is memoized in
+    ``fragments`` keyed by the track's rendered fields, and whole
+    now-playing embeds in ``payloads``; cached embeds are shared, so callers
+    must not modify them.
+    """
+
+    fragments: ClassVar[RenderCache[_TrackText]] = RenderCache(4096)
+    payloads: ClassVar[RenderCache[discord.Embed]] = RenderCache(256)
+
+    @classmethod
+    def _text(cls, track: Track) -> _TrackText:
+        return cls.fragments.get_or_render(
+            _track_key(track), lambda: _render_track_text(track)
+        )
+
+    @classmethod
+    def now_playing(
+        cls, track: Track, loop_mode: LoopMode = LoopMode.OFF
+    ) -> discord.Embed:
+        return cls.payloads.get_or_render(
+            ("now_playing", _track_key(track), loop_mode),
+            lambda: cls._render_now_playing(track, loop_mode),
+        )
+
+    @classmethod
+    def _render_now_playing(cls, track: Track, loop_mode: LoopMode) -> discord.Embed:
+        text = cls._text(track)
         embed = discord.Embed(
             title=f"{Emoji.DISC} Now playing{loop_indicator(loop_mode)}",
-            description=f"### [{_truncate(track.title, 100)}]({track.webpage_url})",
+            description=text.heading,
             color=Theme.PLAYING,
         )
         if track.uploader:
@@ -121,7 +222,7 @@ class Embeds:
             )
         embed.add_field(
             name=f"{Emoji.HOURGLASS} Duration",
-            value=format_duration(track.duration),
+            value=text.duration,
             inline=True,
         )
         embed.add_field(
@@ -133,17 +234,18 @@ class Embeds:
             embed.set_thumbnail(url=track.thumbnail)
         return _apply_footer(embed)
 
-    @staticmethod
-    def added(track: Track, position: int, queue_size: int) -> discord.Embed:
+    @classmethod
+    def added(cls, track: Track, position: int, queue_size: int) -> discord.Embed:
+        text = cls._text(track)
         embed = discord.Embed(
             title=f"{Emoji.OK} Added to queue",
-            description=f"### [{_truncate(track.title, 100)}]({track.webpage_url})",
+            description=text.heading,
             color=Theme.SUCCESS,
         )
         embed.add_field(name="Position", value=f"`#{position}`", inline=True)
         embed.add_field(
             name=f"{Emoji.HOURGLASS} Duration",
-            value=format_duration(track.duration),
+            value=text.duration,
             inline=True,
         )
         embed.add_field(
@@ -153,17 +255,100 @@ class Embeds:
         )
         if track.thumbnail:
             embed.set_thumbnail(url=track.thumbnail)
-        suffix = f"In queue: {queue_size}" if queue_size else None
+        meta_parts = []
+        if track.placeholder:
+            meta_parts.append(f"{Emoji.HOURGLASS} Loading track info…")
+        if queue_size:
+            meta_parts.append(f"In queue: {queue_size}")
+        suffix = " • ".join(meta_parts) if meta_parts else None
         return _apply_footer(embed, suffix)
 
     @staticmethod
+    def playlist_added(
+        title: str,
+        url: str,
+        added: int,
+        requester: discord.Member,
+        *,
+        loading: bool,
+    ) -> discord.Embed:
+        embed = discord.Embed(
+            title=f"{Emoji.OK} Playlist added to queue",
+            description=f"### [{_truncate(title, 100)}]({url})",
+            color=Theme.SUCCESS,
+        )
+        embed.add_field(name="Tracks", value=f"`{added}`", inline=True)
+        embed.add_field(
+            name=f"{Emoji.MUSIC} Requested by",
+            value=requester.mention,
+            inline=True,
+        )
+        suffix = f"{Emoji.HOURGLASS} Loading more tracks…" if loading else None
+        return _apply_footer(embed, suffix)
+
+    @classmethod
+    def batch_added(
+        cls,
+        added: list[tuple[int, Track]],
+        failed: list[tuple[str, str]],
+        queue_size: int,
+        *,
+        limit: int = 10,
+    ) -> discord.Embed:
+        """Summary for a multi-query /play: what was queued and what was not."""
+        if added:
+            noun = "track" if len(added) == 1 else "tracks"
+            embed = discord.Embed(
+                title=f"{Emoji.OK} Added {len(added)} {noun} to queue",
+                color=Theme.SUCCESS,
+            )
+        else:
+            embed = discord.Embed(
+                title=f"{Emoji.ERROR} Nothing was added", color=Theme.DANGER
+            )
+        if added:
+            lines = [
+                f"`#{position}` {cls._text(track).line}"
+                for position, track in added[:limit]
+            ]
+            if len(added) > limit:
+                lines.append(f"*…and **{len(added) - limit}** more*")
+            embed.add_field(
+                name=f"{Emoji.MUSIC} Queued", value="\n".join(lines), inline=False
+            )
+        if failed:
+            lines = [
+                f"{Emoji.ERROR} `{_truncate(query, 60)}`: {_truncate(reason, 120)}"
+                for query, reason in failed[:limit]
+            ]
+            if len(failed) > limit:
+                lines.append(f"*…and **{len(failed) - limit}** more*")
+            embed.add_field(
+                name=f"{Emoji.WARN} Not added", value="\n".join(lines), inline=False
+            )
+        suffix = f"In queue: {queue_size}" if queue_size else None
+        return _apply_footer(embed, suffix)
+
+    @classmethod
     def queue(
+        cls,
         tracks: list[Track],
         current: Track | None,
         loop_mode: LoopMode,
         *,
-        limit: int = 15,
+        start: int = 0,
+        total_tracks: int | None = None,
+        total_duration: int | None = None,
+        shuffle: bool = False,
+        page: int = 1,
+        pages: int = 1,
     ) -> discord.Embed:
+        """Render one page of the queue.
+
+        ``tracks`` is just that page, starting at 0-based queue position
+        ``start``; ``total_tracks`` and ``total_duration`` describe the whole
+        queue.
+        """
         embed = discord.Embed(
             title=f"{Emoji.QUEUE} Playback queue",
             color=Theme.QUEUED,
@@ -173,25 +358,20 @@ class Embeds:
             embed.description = (
                 f"**{Emoji.PLAY} Now playing**\n"
                 f"[{_truncate(current.title, 80)}]({current.webpage_url})"
-                f" • `{format_duration(current.duration)}`"
+                f" • `{cls._text(current).duration}`"
                 f" • {current.requester.mention}"
             )
 
+        count = total_tracks if total_tracks is not None else len(tracks)
         if tracks:
-            lines: list[str] = []
-            for index, track in enumerate(tracks[:limit], start=1):
-                lines.append(
-                    f"`{index:>2}.` **[{_truncate(track.title, 60)}]"
-                    f"({track.webpage_url})** • "
-                    f"`{format_duration(track.duration)}` • "
-                    f"{track.requester.mention}"
-                )
-            if len(tracks) > limit:
-                lines.append(f"*…and **{len(tracks) - limit}** more tracks*")
+            lines = [
+                f"`{index:>2}.` {cls._text(track).line}"
+                for index, track in enumerate(tracks, start=start + 1)
+            ]
 
             field_value = "\n".join(lines)
             embed.add_field(
-                name=f"{Emoji.MUSIC} Up next ({len(tracks)})",
+                name=f"{Emoji.MUSIC} Up next ({count})",
                 value=field_value,
                 inline=False,
             )
@@ -204,12 +384,20 @@ class Embeds:
                 inline=False,
             )
 
-        total = sum(t.duration for t in tracks if t.duration > 0)
+        total = (
+            total_duration
+            if total_duration is not None
+            else sum(t.duration for t in tracks if t.duration > 0)
+        )
         meta_parts = []
+        if pages > 1:
+            meta_parts.append(f"Page {page}/{pages}")
         if total:
             meta_parts.append(f"Total time: {format_duration(total)}")
         if loop_mode is not LoopMode.OFF:
             meta_parts.append(f"Loop: {loop_mode.label}")
+        if shuffle:
+            meta_parts.append("Shuffle: on")
         suffix = " • ".join(meta_parts) if meta_parts else None
         return _apply_footer(embed, suffix)
 
@@ -231,15 +419,18 @@ class Embeds:
         )
         return _apply_footer(embed, "Pick a track below")
 
-    @staticmethod
-    def progress(track: Track, elapsed: float, loop_mode: LoopMode) -> discord.Embed:
+    @classmethod
+    def progress(
+        cls, track: Track, elapsed: float, loop_mode: LoopMode
+    ) -> discord.Embed:
+        text = cls._text(track)
         bar = progress_bar(elapsed, track.duration)
         embed = discord.Embed(
             title=f"{Emoji.DISC} Now playing{loop_indicator(loop_mode)}",
             description=(
-                f"### [{_truncate(track.title, 100)}]({track.webpage_url})\n\n"
+                f"{text.heading}\n\n"
                 f"`{bar}`\n"
-                f"`{format_duration(elapsed)} / {format_duration(track.duration)}`"
+                f"`{format_duration(elapsed)} / {text.duration}`"
             ),
             color=Theme.PLAYING,
         )
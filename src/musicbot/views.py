@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
-from typing import TYPE_CHECKING, Any, ClassVar
+import re
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import discord
 
@@ -13,6 +13,7 @@ from .source import entry_title, entry_uploader
 from .ui import Embeds, Emoji, format_duration
 
 if TYPE_CHECKING:
+    from .bot import MusicBot
     from .player import GuildPlayer
     from .track import Track
 
@@ -29,70 +30,138 @@ def _loop_button_style(_mode: LoopMode) -> discord.ButtonStyle:
 
 
 class NowPlayingView(discord.ui.View):
-    """Persistent control panel attached to the now-playing message."""
+    """Components of the now-playing message, reflecting the player's state.
+
+    The view only carries the buttons: it is stopped right away, so sending
+    it never adds an entry to discord.py's view store. Clicks are routed by
+    custom_id to :class:`NowPlayingControl`, registered once at startup,
+    which also keeps the buttons working after a restart.
+    """
 
     def __init__(self, player: GuildPlayer) -> None:
         super().__init__(timeout=None)
-        self.player = player
-        self._sync_buttons()
-
-    def _sync_buttons(self) -> None:
-        if self.player.is_paused:
-            self.pause_resume.emoji = Emoji.PLAY
-            self.pause_resume.label = "Resume"
+        guild_id = player.guild.id
+        if player.is_paused:
+            pause = NowPlayingControl("pause", guild_id, emoji=Emoji.PLAY, label="Resume")
         else:
-            self.pause_resume.emoji = Emoji.PAUSE
-            self.pause_resume.label = "Pause"
-        mode = self.player.queue.loop_mode
-        self.loop.emoji = _LOOP_EMOJI[mode]
-        self.loop.style = _loop_button_style(mode)
+            pause = NowPlayingControl("pause", guild_id, emoji=Emoji.PAUSE, label="Pause")
+        mode = player.queue.loop_mode
+        for item in (
+            pause,
+            NowPlayingControl("skip", guild_id, emoji=Emoji.SKIP, label="Skip"),
+            NowPlayingControl(
+                "loop",
+                guild_id,
+                emoji=_LOOP_EMOJI[mode],
+                label="Loop",
+                style=_loop_button_style(mode),
+            ),
+            NowPlayingControl("queue", guild_id, emoji=Emoji.QUEUE, label="Queue"),
+            NowPlayingControl("stop", guild_id, emoji=Emoji.STOP, label="Stop"),
+        ):
+            self.add_item(item)
+        self.stop()
+
+
+class NowPlayingControl(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"np:(?P<action>pause|skip|loop|queue|stop):(?P<guild_id>[0-9]+)",
+):
+    """Stateless handler for every guild's now-playing buttons.
+
+    The custom_id carries the action and the guild; the player is looked up
+    on each click.
+    """
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+    def __init__(
+        self,
+        action: str,
+        guild_id: int,
+        *,
+        emoji: str | None = None,
+        label: str | None = None,
+        style: discord.ButtonStyle = discord.ButtonStyle.secondary,
+    ) -> None:
+        super().__init__(
+            discord.ui.Button(
+                emoji=emoji,
+                label=label,
+                style=style,
+                custom_id=f"np:{action}:{guild_id}",
+                row=0,
+            )
+        )
+        self.action = action
+        self.guild_id = guild_id
+
+    @classmethod
+    async def from_custom_id(
+        cls,
+        interaction: discord.Interaction,
+        item: discord.ui.Button,
+        match: re.Match[str],
+    ) -> NowPlayingControl:
+        return cls(match["action"], int(match["guild_id"]))
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        player = await self._player_for(interaction)
+        if player is None:
+            return
+        handler = {
+            "pause": self._pause_resume,
+            "skip": self._skip,
+            "loop": self._loop,
+            "queue": self._show_queue,
+            "stop": self._stop,
+        }[self.action]
+        await handler(interaction, player)
+
+    async def _player_for(self, interaction: discord.Interaction) -> GuildPlayer | None:
         member = interaction.user
-        if not isinstance(member, discord.Member):
+        if not isinstance(member, discord.Member) or member.guild.id != self.guild_id:
             await interaction.response.send_message(
                 embed=Embeds.error("Buttons are only available on a server."),
                 ephemeral=True,
             )
-            return False
-        if not self.player.is_listener(member):
+            return None
+        bot = cast("MusicBot", interaction.client)
+        player = bot.players.get_existing(self.guild_id)
+        if player is None or player.current is None:
+            # A leftover panel, e.g. from before a restart: retire it.
+            await interaction.response.edit_message(view=None)
+            await interaction.followup.send(
+                embed=Embeds.warning("Nothing is playing right now."), ephemeral=True
+            )
+            return None
+        if not player.is_listener(member):
             await interaction.response.send_message(
                 embed=Embeds.error(
                     "Join the same voice channel as the bot to control the player."
                 ),
                 ephemeral=True,
             )
-            return False
-        return True
-
-    @discord.ui.button(emoji=Emoji.PAUSE, label="Pause", style=discord.ButtonStyle.secondary, row=0)
-    async def pause_resume(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ) -> None:
-        if self.player.is_paused:
-            self.player.resume()
-        elif self.player.is_playing:
-            self.player.pause()
+            return None
+        return player
+
+    @staticmethod
+    async def _pause_resume(interaction: discord.Interaction, player: GuildPlayer) -> None:
+        if player.is_paused:
+            player.resume()
+        elif player.is_playing:
+            player.pause()
         else:
             await interaction.response.send_message(
                 embed=Embeds.warning("Nothing is playing right now."),
                 ephemeral=True,
             )
             return
-        self._sync_buttons()
-        await interaction.response.edit_message(view=self)
+        await interaction.response.edit_message(view=NowPlayingView(player))
 
-    @discord.ui.button(emoji=Emoji.SKIP, label="Skip", style=discord.ButtonStyle.secondary, row=0)
-    async def skip(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ) -> None:
+    @staticmethod
+    async def _skip(interaction: discord.Interaction, player: GuildPlayer) -> None:
         member = interaction.user
         assert isinstance(member, discord.Member)
-        result = await self.player.vote_skip(member)
+        result = await player.vote_skip(member)
         if result.skipped:
             embed = Embeds.success(result.message)
         elif result.error:
@@ -101,42 +170,27 @@ class NowPlayingView(discord.ui.View):
             embed = Embeds.warning(result.message)
         await interaction.response.send_message(embed=embed, ephemeral=not result.skipped)
 
-    @discord.ui.button(emoji=Emoji.LOOP_OFF, label="Loop", style=discord.ButtonStyle.secondary, row=0)
-    async def loop(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ) -> None:
-        mode = self.player.queue.cycle_loop_mode()
-        self._sync_buttons()
-        await interaction.response.edit_message(view=self)
+    @staticmethod
+    async def _loop(interaction: discord.Interaction, player: GuildPlayer) -> None:
+        mode = player.queue.cycle_loop_mode()
+        await interaction.response.edit_message(view=NowPlayingView(player))
         await interaction.followup.send(
             embed=Embeds.info(f"Loop mode: **{mode.label}**."),
             ephemeral=True,
         )
 
-    @discord.ui.button(emoji=Emoji.QUEUE, label="Queue", style=discord.ButtonStyle.secondary, row=0)
-    async def show_queue(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ) -> None:
-        embed = Embeds.queue(
-            self.player.queue.snapshot(),
-            self.player.current,
-            self.player.queue.loop_mode,
+    @staticmethod
+    async def _show_queue(interaction: discord.Interaction, player: GuildPlayer) -> None:
+        view = QueueView(player)
+        await interaction.response.send_message(
+            embed=view.render(), view=view, ephemeral=True
         )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    @discord.ui.button(emoji=Emoji.STOP, label="Stop", style=discord.ButtonStyle.secondary, row=0)
-    async def stop(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ) -> None:
+    @staticmethod
+    async def _stop(interaction: discord.Interaction, player: GuildPlayer) -> None:
         member = interaction.user
         assert isinstance(member, discord.Member)
-        if not self.player.can_control(member):
+        if not player.can_control(member):
             await interaction.response.send_message(
                 embed=Embeds.error(
                     "Only an admin or the track requester can stop the player."
@@ -147,58 +201,224 @@ class NowPlayingView(discord.ui.View):
         await interaction.response.send_message(
             embed=Embeds.info("Stopping playback and leaving the channel.")
         )
-        await self.player.stop()
+        await player.stop()
 
 
 class RemoveTrackView(discord.ui.View):
-    """Single-button view for removing the just-added track from the queue."""
+    """Remove button for the "added to queue" message.
 
-    REMOVE_TIMEOUT: ClassVar[float] = 600.0
+    Like :class:`NowPlayingView` it only carries the component; clicks go to
+    :class:`RemoveTrackButton`, so nothing per message is kept alive.
+    """
 
     def __init__(self, player: GuildPlayer, track: Track) -> None:
-        super().__init__(timeout=self.REMOVE_TIMEOUT)
-        self.player = player
-        self.track = track
+        super().__init__(timeout=None)
+        # Handles start at 1, so 0 (track already gone) never matches.
+        handle = player.queue.handle_of(track) or 0
+        self.add_item(RemoveTrackButton(player.guild.id, player.queue.token, handle))
+        self.stop()
+
+
+def _disabled_remove_view() -> discord.ui.View:
+    view = discord.ui.View(timeout=None)
+    view.add_item(
+        discord.ui.Button(
+            label="Remove",
+            emoji=Emoji.REMOVE,
+            style=discord.ButtonStyle.danger,
+            disabled=True,
+        )
+    )
+    view.stop()
+    return view
 
-    @discord.ui.button(label="Remove", emoji=Emoji.REMOVE, style=discord.ButtonStyle.danger)
-    async def remove(
-        self,
+
+class RemoveTrackButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"rm:(?P<guild_id>[0-9]+):(?P<token>[0-9]+):(?P<handle>[0-9]+)",
+):
+    """Stateless remove button; the custom_id names the queue entry by handle."""
+
+    def __init__(self, guild_id: int, token: int, handle: int) -> None:
+        super().__init__(
+            discord.ui.Button(
+                label="Remove",
+                emoji=Emoji.REMOVE,
+                style=discord.ButtonStyle.danger,
+                custom_id=f"rm:{guild_id}:{token}:{handle}",
+            )
+        )
+        self.guild_id = guild_id
+        self.token = token
+        self.handle = handle
+
+    @classmethod
+    async def from_custom_id(
+        cls,
         interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ) -> None:
-        member = interaction.user
-        assert isinstance(member, discord.Member)
+        item: discord.ui.Button,
+        match: re.Match[str],
+    ) -> RemoveTrackButton:
+        return cls(int(match["guild_id"]), int(match["token"]), int(match["handle"]))
 
-        if member.id != self.track.requester.id and not member.guild_permissions.administrator:
+    async def callback(self, interaction: discord.Interaction) -> None:
+        member = interaction.user
+        if not isinstance(member, discord.Member) or member.guild.id != self.guild_id:
             await interaction.response.send_message(
-                embed=Embeds.error("You can only remove your own track (or an admin can)."),
+                embed=Embeds.error("Buttons are only available on a server."),
                 ephemeral=True,
             )
             return
 
-        position = self.player.queue.position_of(self.track)
-        if position is None:
-            await interaction.response.send_message(
+        bot = cast("MusicBot", interaction.client)
+        player = bot.players.get_existing(self.guild_id)
+        queue = player.queue if player is not None else None
+        track = (
+            queue.get_by_handle(self.handle)
+            if queue is not None and queue.token == self.token
+            else None
+        )
+        if queue is None or track is None:
+            await interaction.response.edit_message(view=_disabled_remove_view())
+            await interaction.followup.send(
                 embed=Embeds.warning("Track is no longer in the queue."),
                 ephemeral=True,
             )
-            self._disable_all()
-            if interaction.message is not None:
-                with contextlib.suppress(discord.HTTPException):
-                    await interaction.message.edit(view=self)
             return
 
-        self.player.queue.remove_at(position)
-        self._disable_all()
-        await interaction.response.edit_message(view=self)
+        if member.id != track.requester.id and not member.guild_permissions.administrator:
+            await interaction.response.send_message(
+                embed=Embeds.error("You can only remove your own track (or an admin can)."),
+                ephemeral=True,
+            )
+            return
+
+        position = queue.position_of_handle(self.handle)
+        assert position is not None
+        queue.remove_at(position)
+        await interaction.response.edit_message(view=_disabled_remove_view())
         await interaction.followup.send(
-            embed=Embeds.success(f"Track **{self.track.title}** removed from the queue."),
+            embed=Embeds.success(f"Track **{track.title}** removed from the queue."),
         )
 
-    def _disable_all(self) -> None:
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                child.disabled = True
+
+class QueuePages:
+    """Rendered queue pages for one guild, reused until the queue changes.
+
+    Pages are read from the queue one slice at a time and cached against the
+    queue's ``version``, the current track and the loop/shuffle state; any
+    change there drops every cached page.
+    """
+
+    PAGE_SIZE: ClassVar[int] = 10
+
+    def __init__(self, player: GuildPlayer) -> None:
+        self.player = player
+        self._pages: dict[int, discord.Embed] = {}
+        self._state: tuple[int, LoopMode, bool] | None = None
+        self._current: Track | None = None
+
+    @property
+    def count(self) -> int:
+        return max(1, -(-len(self.player.queue) // self.PAGE_SIZE))
+
+    def render(self, page: int) -> discord.Embed:
+        """Embed for 1-based ``page`` (clamped to the available pages)."""
+        queue = self.player.queue
+        state = (queue.version, queue.loop_mode, queue.shuffle_mode)
+        if state != self._state or self.player.current is not self._current:
+            self._pages.clear()
+            self._state = state
+            self._current = self.player.current
+
+        pages = self.count
+        page = max(1, min(page, pages))
+        embed = self._pages.get(page)
+        if embed is None:
+            start = (page - 1) * self.PAGE_SIZE
+            embed = Embeds.queue(
+                queue.page(start, start + self.PAGE_SIZE),
+                self.player.current,
+                queue.loop_mode,
+                start=start,
+                total_tracks=len(queue),
+                total_duration=queue.total_duration(),
+                shuffle=queue.shuffle_mode,
+                page=page,
+                pages=pages,
+            )
+            self._pages[page] = embed
+        return embed
+
+
+class QueueJumpModal(discord.ui.Modal, title="Go to page"):
+    page: discord.ui.TextInput = discord.ui.TextInput(
+        label="Page number", min_length=1, max_length=4
+    )
+
+    def __init__(self, view: QueueView) -> None:
+        super().__init__()
+        self.queue_view = view
+        self.page.placeholder = f"1–{view.pages.count}"
+
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        try:
+            page = int(self.page.value)
+        except ValueError:
+            await interaction.response.send_message(
+                embed=Embeds.error("Enter a page number."), ephemeral=True
+            )
+            return
+        await self.queue_view.show(interaction, page)
+
+
+class QueueView(discord.ui.View):
+    """Prev/next/jump pagination for the queue embed."""
+
+    PAGE_TIMEOUT: ClassVar[float] = 300.0
+
+    def __init__(self, player: GuildPlayer) -> None:
+        super().__init__(timeout=self.PAGE_TIMEOUT)
+        self.pages = player.queue_pages
+        self.page = 1
+
+    def render(self) -> discord.Embed:
+        pages = self.pages.count
+        self.page = max(1, min(self.page, pages))
+        self.previous.disabled = self.page <= 1
+        self.next.disabled = self.page >= pages
+        self.jump.disabled = pages <= 1
+        self.jump.label = f"{self.page}/{pages}"
+        return self.pages.render(self.page)
+
+    async def show(self, interaction: discord.Interaction, page: int) -> None:
+        self.page = page
+        embed = self.render()
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button,
+    ) -> None:
+        await self.show(interaction, self.page - 1)
+
+    @discord.ui.button(label="1/1", style=discord.ButtonStyle.secondary)
+    async def jump(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button,
+    ) -> None:
+        await interaction.response.send_modal(QueueJumpModal(self))
+
+    @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next(
+        self,
+        interaction: discord.Interaction,
+        button: discord.ui.Button,
+    ) -> None:
+        await self.show(interaction, self.page + 1)
 
 
 class SearchSelect(discord.ui.Select):
@@ -0,0 +1,132 @@
+import asyncio
+import operator
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from musicbot.extraction import ExtractionScheduler
+
+
+class _Tracker:
+    """Blocking job body that records how many jobs of each guild overlap."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.running: Counter[int] = Counter()
+        self.peak: Counter[int] = Counter()
+        self.peak_total = 0
+        self.order: list[int] = []
+
+    def job(self, guild_id: int, seconds: float) -> int:
+        with self._lock:
+            self.order.append(guild_id)
+            self.running[guild_id] += 1
+            self.peak[guild_id] = max(self.peak[guild_id], self.running[guild_id])
+            self.peak_total = max(self.peak_total, self.running.total())
+        time.sleep(seconds)
+        with self._lock:
+            self.running[guild_id] -= 1
+        return guild_id
+
+
+def test_never_runs_more_than_the_guild_cap() -> None:
+    async def main() -> None:
+        scheduler = ExtractionScheduler(workers=4, per_guild=2)
+        tracker = _Tracker()
+        try:
+            results = await asyncio.gather(
+                *(scheduler.run(1, tracker.job, 1, 0.02) for _ in range(8)),
+                *(scheduler.run(2, tracker.job, 2, 0.02) for _ in range(8)),
+            )
+        finally:
+            scheduler.shutdown()
+        assert sorted(results) == [1] * 8 + [2] * 8
+        assert tracker.peak[1] == tracker.peak[2] == 2
+        assert tracker.peak_total <= 4
+        assert scheduler.running == 0
+        assert scheduler.queue_depth == 0
+
+    asyncio.run(main())
+
+
+def test_busy_guild_leaves_slots_for_others() -> None:
+    async def main() -> None:
+        scheduler = ExtractionScheduler(workers=3, per_guild=2)
+        tracker = _Tracker()
+        try:
+            busy = [scheduler.run(1, tracker.job, 1, 0.05) for _ in range(10)]
+            late = scheduler.run(2, tracker.job, 2, 0.0)
+            await asyncio.gather(*busy, late)
+        finally:
+            scheduler.shutdown()
+        assert tracker.peak[1] == 2
+        # Guild 2's single job got the free slot right away.
+        assert tracker.order.index(2) <= 2
+
+    asyncio.run(main())
+
+
+def test_alternates_between_waiting_guilds() -> None:
+    async def main() -> None:
+        scheduler = ExtractionScheduler(workers=1, per_guild=1)
+        tracker = _Tracker()
+        gate = threading.Event()
+        try:
+            blocker = asyncio.ensure_future(scheduler.run(None, gate.wait, 5))
+            await asyncio.sleep(0)
+            jobs = [scheduler.run(1, tracker.job, 1, 0.0) for _ in range(3)]
+            jobs += [scheduler.run(2, tracker.job, 2, 0.0) for _ in range(3)]
+            jobs += [scheduler.run(3, tracker.job, 3, 0.0)]
+            pending = [asyncio.ensure_future(job) for job in jobs]
+            await asyncio.sleep(0)
+            assert scheduler.guild_depth(1) == 3
+            gate.set()
+            await asyncio.gather(blocker, *pending)
+        finally:
+            scheduler.shutdown()
+        assert tracker.order == [1, 2, 3, 1, 2, 1, 2]
+
+    asyncio.run(main())
+
+
+def test_cancelled_jobs_are_skipped_and_errors_propagate() -> None:
+    async def main() -> None:
+        scheduler = ExtractionScheduler(workers=1, per_guild=1)
+        tracker = _Tracker()
+        gate = threading.Event()
+
+        def fail() -> None:
+            raise ValueError("extract failed")
+
+        try:
+            blocker = asyncio.ensure_future(scheduler.run(1, gate.wait, 5))
+            doomed = asyncio.ensure_future(scheduler.run(1, tracker.job, 1, 0.0))
+            failing = asyncio.ensure_future(scheduler.run(1, fail))
+            await asyncio.sleep(0)
+            doomed.cancel()
+            gate.set()
+            await blocker
+            with pytest.raises(ValueError, match="extract failed"):
+                await failing
+        finally:
+            scheduler.shutdown()
+        assert tracker.order == []
+        assert scheduler.stats.cancelled == 1
+        assert scheduler.stats.started == 2
+
+    asyncio.run(main())
+
+
+def test_process_workers_run_jobs() -> None:
+    async def main() -> None:
+        scheduler = ExtractionScheduler(workers=1, per_guild=1, processes=True)
+        try:
+            assert await scheduler.run(1, operator.add, 2, 3) == 5
+            with pytest.raises(ZeroDivisionError):
+                await scheduler.run(1, operator.truediv, 1, 0)
+        finally:
+            scheduler.shutdown()
+
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from musicbot.indexed_list import IndexedList
+
+
+def _check(items: IndexedList[int], model: list[int], handles: dict[int, int]) -> None:
+    assert len(items) == len(model)
+    assert list(items) == model
+    for value, handle in handles.items():
+        assert items.get(handle) == value
+        assert items.index_of(handle) == model.index(value)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_plain_list_under_random_edits(seed: int) -> None:
+    rng = random.Random(seed)
+    items: IndexedList[int] = IndexedList()
+    model: list[int] = []
+    handles: dict[int, int] = {}  # value -> handle
+    next_value = 0
+
+    for _ in range(400):
+        op = rng.random()
+        if op < 0.45 or not model:
+            index = rng.randint(0, len(model))
+            handles[next_value] = items.insert(index, next_value)
+            model.insert(index, next_value)
+            next_value += 1
+        elif op < 0.75:
+            index = rng.randrange(len(model))
+            value = model.pop(index)
+            assert items.pop(index) == value
+            assert items.get(handles[value]) is None
+            assert items.index_of(handles.pop(value)) is None
+        else:
+            src, dst = rng.randrange(len(model)), rng.randrange(len(model))
+            items.move(src, dst)
+            model.insert(dst, model.pop(src))
+        _check(items, model, handles)
+
+    for index, value in enumerate(model):
+        assert items[index] == value
+        assert items.handle_at(index) == handles[value]
+    for start in range(len(model) + 1):
+        assert list(items.iter_from(start)) == model[start:]
+        assert items.slice(start, start + 7) == model[start : start + 7]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_handle_by_weight_matches_cumulative_weights(seed: int) -> None:
+    rng = random.Random(seed)
+    items: IndexedList[int] = IndexedList()
+    weights: dict[int, int] = {}
+    for value in range(60):
+        weight = rng.choice((0, 1, 1, 2))
+        handle = items.insert(rng.randint(0, len(items)), value, weight=weight)
+        weights[handle] = weight
+    for handle in rng.sample(sorted(weights), 20):
+        weights[handle] = rng.choice((0, 1, 3))
+        items.set_weight(handle, weights[handle])
+
+    expected = [
+        items.handle_at(index)
+        for index in range(len(items))
+        for _ in range(weights[items.handle_at(index)])
+    ]
+    assert items.total_weight == len(expected)
+    assert [items.handle_by_weight(offset) for offset in range(len(expected))] == expected
+    with pytest.raises(IndexError):
+        items.handle_by_weight(len(expected))
+
+    items.reset_weights(1)
+    assert items.total_weight == len(items)
+    assert [items.handle_by_weight(i) for i in range(len(items))] == [
+        items.handle_at(i) for i in range(len(items))
+    ]
+
+
+def test_out_of_range_positions_raise() -> None:
+    items = IndexedList([1, 2, 3])
+    with pytest.raises(IndexError):
+        items[3]
+    with pytest.raises(IndexError):
+        items.insert(4, 0)
+    with pytest.raises(IndexError):
+        items.pop(-1)
+    with pytest.raises(IndexError):
+        items.move(0, 3)
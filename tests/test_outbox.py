@@ -0,0 +1,174 @@
+import asyncio
+from typing import Any
+
+import discord
+import pytest
+
+from musicbot import outbox as outbox_module
+from musicbot.outbox import ChannelOutbox, _ChannelBucket
+
+
+class _Message:
+    def __init__(self, channel: "_Channel", **fields: Any) -> None:
+        self.channel = channel
+        self.fields = fields
+        self.edits: list[dict[str, Any]] = []
+
+    async def edit(self, **fields: Any) -> "_Message":
+        self.channel.calls.append(("edit", fields))
+        self.edits.append(fields)
+        await self.channel.edit_delay()
+        return self
+
+
+class _Channel:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.messages: list[_Message] = []
+        self.edit_seconds = 0.0
+
+    async def send(self, **fields: Any) -> _Message:
+        self.calls.append(("send", fields))
+        message = _Message(self, **fields)
+        self.messages.append(message)
+        return message
+
+    async def edit_delay(self) -> None:
+        await asyncio.sleep(self.edit_seconds)
+
+    def sends(self) -> list[dict[str, Any]]:
+        return [fields for kind, fields in self.calls if kind == "send"]
+
+
+def _outbox(channel: _Channel, **overrides: float) -> ChannelOutbox:
+    """An outbox with some class settings overridden, e.g. ``rate=2``."""
+    settings = {"DEBOUNCE": 0.01} | {name.upper(): value for name, value in overrides.items()}
+    cls = type("TestOutbox", (ChannelOutbox,), settings)
+    return cls(channel)  # type: ignore[arg-type]
+
+
+def _embed(title: str) -> discord.Embed:
+    return discord.Embed(title=title)
+
+
+def test_burst_of_notices_goes_out_as_one_message() -> None:
+    async def main() -> None:
+        channel = _Channel()
+        outbox = _outbox(channel)
+        for n in range(4):
+            outbox.notify(_embed(f"notice {n}"))
+        await outbox.close(1.0)
+        sends = channel.sends()
+        assert len(sends) == 1
+        assert [e.title for e in sends[0]["embeds"]] == [f"notice {n}" for n in range(4)]
+
+    asyncio.run(main())
+
+
+def test_notices_beyond_the_embed_limit_split() -> None:
+    async def main() -> None:
+        channel = _Channel()
+        outbox = _outbox(channel)
+        for n in range(ChannelOutbox.MAX_EMBEDS + 3):
+            outbox.notify(_embed(str(n)))
+        await outbox.close(1.0)
+        assert [len(s["embeds"]) for s in channel.sends()] == [ChannelOutbox.MAX_EMBEDS, 3]
+
+    asyncio.run(main())
+
+
+def test_now_playing_is_debounced_latest_wins() -> None:
+    async def main() -> None:
+        channel = _Channel()
+        outbox = _outbox(channel, debounce=0.05)
+        view = object()
+        for n in range(5):
+            outbox.show_now_playing(_embed(f"track {n}"), view)  # type: ignore[arg-type]
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.1)
+        assert channel.sends() == [{"embed": channel.messages[0].fields["embed"], "view": view}]
+        assert channel.messages[0].fields["embed"].title == "track 4"
+
+        # The next track edits the same message in place.
+        outbox.show_now_playing(_embed("track 5"), view)  # type: ignore[arg-type]
+        await asyncio.sleep(0.1)
+        assert len(channel.sends()) == 1
+        assert channel.messages[0].edits[-1]["embed"].title == "track 5"
+        await outbox.close(1.0)
+
+    asyncio.run(main())
+
+
+def test_buried_now_playing_is_reposted_below_notices() -> None:
+    async def main() -> None:
+        channel = _Channel()
+        outbox = _outbox(channel)
+        view = object()
+        outbox.show_now_playing(_embed("track 1"), view)  # type: ignore[arg-type]
+        await asyncio.sleep(0.05)
+        outbox.notify(_embed("error"))
+        outbox.show_now_playing(_embed("track 2"), view)  # type: ignore[arg-type]
+        await asyncio.sleep(0.05)
+        first, _notice, second = channel.messages
+        assert first.edits == [{"view": None}]  # old controls stripped
+        assert second.fields["embed"].title == "track 2"
+        await outbox.close(1.0)
+
+    asyncio.run(main())
+
+
+def test_bucket_paces_to_rate_per_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr(outbox_module.time, "monotonic", lambda: now[0])
+    bucket = _ChannelBucket(rate=5, per=5.0)
+    for _ in range(5):
+        assert bucket.delay() == 0.0
+        bucket.consume()
+        now[0] += 0.5
+    assert bucket.delay() == pytest.approx(2.5)
+    now[0] = 5.0
+    assert bucket.delay() == 0.0
+
+
+def test_sends_are_paced_by_the_bucket() -> None:
+    async def main() -> None:
+        channel = _Channel()
+        outbox = _outbox(channel, rate=2, per=0.2)
+        loop = asyncio.get_running_loop()
+        sent_at: list[float] = []
+        original = channel.send
+
+        async def timed_send(**fields: Any) -> _Message:
+            sent_at.append(loop.time())
+            return await original(**fields)
+
+        channel.send = timed_send  # type: ignore[method-assign]
+        for n in range(3):
+            outbox.notify(_embed(str(n)))
+            await asyncio.sleep(0.01)  # let each go out on its own
+        await outbox.close(1.0)
+        assert len(sent_at) == 3
+        assert sent_at[2] - sent_at[0] >= 0.19
+
+    asyncio.run(main())
+
+
+def test_progress_edit_declined_while_busy_and_backs_off_on_timeout() -> None:
+    async def main() -> None:
+        channel = _Channel()
+        outbox = _outbox(channel, progress_timeout=0.05)
+        view = object()
+        outbox.show_now_playing(_embed("track"), view)  # type: ignore[arg-type]
+        # Nothing to edit yet, and a now-playing update is pending.
+        assert not outbox.show_progress(_embed("progress"))
+        await asyncio.sleep(0.05)
+
+        channel.edit_seconds = 1.0  # the HTTP client sleeping through a 429
+        assert outbox.show_progress(_embed("progress 1"))
+        await asyncio.sleep(0.1)
+        assert outbox._backoff == ChannelOutbox.BACKOFF_MIN
+        assert not outbox.show_progress(_embed("progress 2"))
+        channel.edit_seconds = 0.0
+        await outbox.close(1.0)
+
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from musicbot.player import GuildPlayer
+from musicbot.source import YTDLSource
+from musicbot.track import Requester, Track
+
+
+class _Source(discord.AudioSource):
+    def __init__(self, *, opus: bool) -> None:
+        self.opus = opus
+        self.cleaned = False
+
+    def read(self) -> bytes:
+        return b""
+
+    def is_opus(self) -> bool:
+        return self.opus
+
+    def cleanup(self) -> None:
+        self.cleaned = True
+
+
+class _AudioPlayer:
+    """What VoiceClient needs of discord.py's AudioPlayer thread."""
+
+    def __init__(self, source: discord.AudioSource) -> None:
+        self.source = source
+
+    def set_source(self, source: discord.AudioSource) -> None:
+        self.source = source
+
+    def is_playing(self) -> bool:
+        return True
+
+    def is_paused(self) -> bool:
+        return False
+
+
+class _Encoder:
+    SAMPLES_PER_FRAME = 960
+
+    def encode(self, pcm: bytes, frame_size: int) -> bytes:
+        return pcm
+
+
+def _playing_opus(loop: asyncio.AbstractEventLoop) -> tuple[GuildPlayer, discord.VoiceClient]:
+    """A player mid-track on a passthrough source, as VoiceClient.play() leaves it."""
+    vc = object.__new__(discord.VoiceClient)
+    vc.encoder = discord.utils.MISSING
+    vc._player = _AudioPlayer(_Source(opus=True))  # type: ignore[assignment]
+    settings = SimpleNamespace(max_tracks_per_user=0, reject_duplicates=False)
+    bot = SimpleNamespace(settings=settings, loop=loop)
+    guild = SimpleNamespace(id=1, voice_client=vc)
+    player = GuildPlayer(bot, guild)  # type: ignore[arg-type]
+    player.current = Track(
+        "https://example.com/a", "A", 60, None, None, Requester(1, 1)
+    )
+    return player, vc
+
+
+def test_volume_change_during_passthrough_gets_an_encoder(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def main() -> None:
+        replacement = _Source(opus=False)
+        monkeypatch.setattr(discord.opus, "Encoder", _Encoder)
+        monkeypatch.setattr(
+            YTDLSource, "make_audio_source", classmethod(lambda cls, *a, **kw: replacement)
+        )
+        player, vc = _playing_opus(asyncio.get_running_loop())
+        original = vc.source
+
+        player.set_volume(0.5)
+
+        assert vc.source is replacement
+        # The voice thread encodes the next PCM frame with this.
+        assert isinstance(vc.encoder, _Encoder)
+        assert vc.encoder.encode(b"\0" * 3840, vc.encoder.SAMPLES_PER_FRAME)
+        assert original is not None and not original.cleaned
+
+    asyncio.run(main())
+
+
+def test_volume_change_keeps_passthrough_without_opus(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def main() -> None:
+        def missing() -> None:
+            raise discord.opus.OpusNotLoaded
+
+        monkeypatch.setattr(discord.opus, "Encoder", missing)
+        monkeypatch.setattr(
+            YTDLSource,
+            "make_audio_source",
+            classmethod(lambda cls, *a, **kw: pytest.fail("no new ffmpeg without an encoder")),
+        )
+        player, vc = _playing_opus(asyncio.get_running_loop())
+        original = vc.source
+
+        assert player.set_volume(0.5) == 0.5
+        assert vc.source is original
+        assert vc.encoder is discord.utils.MISSING
+
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from musicbot.cache import SearchCache
+
+
+class _Fetcher:
+    """A fetch that blocks until released, counting how often it ran."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> list[dict[str, str]]:
+        self.calls += 1
+        await self.release.wait()
+        return [{"id": str(self.calls)}]
+
+
+def test_concurrent_callers_share_one_fetch() -> None:
+    async def main() -> None:
+        cache = SearchCache()
+        fetch = _Fetcher()
+        first = asyncio.ensure_future(cache.get_or_fetch("q", fetch))
+        second = asyncio.ensure_future(cache.get_or_fetch("q", fetch))
+        await asyncio.sleep(0)
+        fetch.release.set()
+        assert await first == await second == [{"id": "1"}]
+        assert fetch.calls == 1
+        stats = cache.query_stats()["q"]
+        assert (stats.requests, stats.extractions, stats.coalesced) == (2, 1, 1)
+
+    asyncio.run(main())
+
+
+def test_cancelling_one_waiter_leaves_the_other() -> None:
+    async def main() -> None:
+        cache = SearchCache()
+        fetch = _Fetcher()
+        quitter = asyncio.ensure_future(cache.get_or_fetch("q", fetch))
+        stayer = asyncio.ensure_future(cache.get_or_fetch("q", fetch))
+        await asyncio.sleep(0)
+        quitter.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+        assert await stayer == [{"id": "1"}]
+        with pytest.raises(asyncio.CancelledError):
+            await quitter
+        assert fetch.calls == 1
+        # The shared result was cached for later callers too.
+        assert await cache.get_or_fetch("q", fetch) == [{"id": "1"}]
+        assert fetch.calls == 1
+
+    asyncio.run(main())
+
+
+def test_results_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def main() -> None:
+        now = [100.0]
+        monkeypatch.setattr("musicbot.cache.time.monotonic", lambda: now[0])
+        cache = SearchCache(ttl=60.0)
+        fetch = _Fetcher()
+        fetch.release.set()
+        assert await cache.get_or_fetch("q", fetch) == [{"id": "1"}]
+        now[0] += 59.0
+        assert await cache.get_or_fetch("q", fetch) == [{"id": "1"}]
+        now[0] += 2.0
+        assert await cache.get_or_fetch("q", fetch) == [{"id": "2"}]
+        assert fetch.calls == 2
+
+    asyncio.run(main())
+
+
+def test_failures_reach_every_waiter_and_are_not_cached() -> None:
+    async def main() -> None:
+        cache = SearchCache()
+        calls = 0
+
+        async def failing() -> list[dict[str, str]]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("search failed")
+
+        waiters = [asyncio.ensure_future(cache.get_or_fetch("q", failing)) for _ in range(3)]
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == 1
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("q", failing)
+        assert calls == 2
+
+    asyncio.run(main())
+
+
+def test_returned_lists_are_copies() -> None:
+    async def main() -> None:
+        cache = SearchCache()
+        fetch = _Fetcher()
+        fetch.release.set()
+        (await cache.get_or_fetch("q", fetch)).clear()
+        assert await cache.get_or_fetch("q", fetch) == [{"id": "1"}]
+
+    asyncio.run(main())
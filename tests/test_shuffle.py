@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from musicbot.music_queue import LoopMode, MusicQueue
+from musicbot.track import Requester, Track
+
+_REQUESTER = Requester(1, 1)
+
+
+def _track(n: int) -> Track:
+    return Track(f"https://example.com/{n}", f"Track {n}", 60, None, None, _REQUESTER)
+
+
+def _shuffled_queue(size: int) -> tuple[MusicQueue, list[Track]]:
+    queue = MusicQueue()
+    tracks = [_track(n) for n in range(size)]
+    for track in tracks:
+        queue.add(track)
+    queue.set_shuffle(True)
+    return queue, tracks
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 40])
+def test_loop_queue_plays_every_track_once_per_round(size: int) -> None:
+    random.seed(size)
+    queue, tracks = _shuffled_queue(size)
+    queue.set_loop_mode(LoopMode.QUEUE)
+
+    # Mirrors the playback loop: the finished track is re-queued before the
+    # next one is drawn, so it sits in the queue with weight 0 for the rest
+    # of the round.
+    current = queue.pop_next()
+    for _ in range(5):
+        played = []
+        for _ in range(size):
+            assert current is not None
+            played.append(current)
+            queue.add(current, requeue=True)
+            upcoming = queue.peek_next()
+            current = queue.pop_next()
+            assert current is upcoming
+        assert sorted(id(t) for t in played) == sorted(id(t) for t in tracks)
+        assert len(queue) == size - 1
+
+
+def test_shuffle_without_loop_drains_every_track_once() -> None:
+    random.seed(0)
+    queue, tracks = _shuffled_queue(25)
+    drawn = []
+    while (track := queue.pop_next()) is not None:
+        drawn.append(track)
+    assert sorted(id(t) for t in drawn) == sorted(id(t) for t in tracks)
+
+
+def test_track_added_mid_round_is_drawn_in_that_round() -> None:
+    random.seed(1)
+    queue, tracks = _shuffled_queue(10)
+    queue.set_loop_mode(LoopMode.QUEUE)
+    current = queue.pop_next()
+    late = _track(99)
+    played = []
+    for step in range(11):
+        assert current is not None
+        played.append(current)
+        queue.add(current, requeue=True)
+        if step == 3:
+            queue.add(late)
+        current = queue.pop_next()
+    assert sorted(id(t) for t in played) == sorted(id(t) for t in [*tracks, late])
+
+
+def test_turning_shuffle_off_restores_stored_order() -> None:
+    random.seed(2)
+    queue, tracks = _shuffled_queue(8)
+    queue.peek_next()
+    queue.set_shuffle(False)
+    assert [queue.pop_next() for _ in tracks] == tracks
@@ -0,0 +1,110 @@
+import asyncio
+import math
+import random
+from collections.abc import Callable, Hashable
+
+from musicbot.timers import TimerWheel
+
+
+class _Harness:
+    """A wheel on a fake clock, stepped by hand instead of by its task.
+
+    ``expected`` maps each armed key to the tick it has to fire on; a key
+    firing on any other tick, twice, or after being cancelled lands in
+    ``wrong`` (the wheel logs and swallows callback exceptions).
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.expected: dict[Hashable, int] = {}
+        self.fired = 0
+        self.wrong: list[tuple[Hashable, int | None, int]] = []
+        self.wheel = TimerWheel(self._on_expire)
+        asyncio.get_running_loop().time = lambda: self.now  # type: ignore[method-assign]
+
+    def _on_expire(self, key: Hashable) -> None:
+        due = self.expected.pop(key, None)
+        if due != self.wheel._tick:
+            self.wrong.append((key, due, self.wheel._tick))
+        self.fired += 1
+
+    def arm(self, key: Hashable, delay: float) -> None:
+        due = math.ceil((self.now + delay) / TimerWheel.RESOLUTION)
+        self.wheel.arm(key, delay)
+        self.wheel._task.cancel()  # type: ignore[union-attr]
+        self.expected[key] = max(due, self.wheel._tick + 1)
+
+    def cancel(self, key: Hashable) -> None:
+        assert self.wheel.cancel(key)
+        del self.expected[key]
+
+    def advance_to(self, tick: int) -> None:
+        while self.wheel._tick < tick:
+            self.now = (self.wheel._tick + 1) * TimerWheel.RESOLUTION
+            self.wheel._step()
+
+
+def _run(test: Callable[[_Harness], None]) -> None:
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            test(_Harness())
+        finally:
+            del loop.time  # type: ignore[method-assign]
+
+    asyncio.run(main())
+
+
+def test_each_deadline_fires_once_at_its_tick() -> None:
+    def check(h: _Harness) -> None:
+        rng = random.Random(0)
+        top = TimerWheel.SLOTS**TimerWheel.LEVELS
+        # Spread over every level, right at the level boundaries, and past
+        # the top level, where timers park and get re-placed.
+        delays = [rng.uniform(0, 2 * top) for _ in range(300)]
+        delays += [
+            float(TimerWheel.SLOTS**level + d) for level in range(4) for d in (-1, 0, 1)
+        ]
+        for key, delay in enumerate(delays):
+            h.arm(key, delay)
+        h.advance_to(max(h.expected.values()))
+        assert h.wrong == []
+        assert h.expected == {}
+        assert h.fired == len(delays)
+        assert len(h.wheel) == 0
+
+    _run(check)
+
+
+def test_rearm_and_cancel_between_ticks() -> None:
+    def check(h: _Harness) -> None:
+        rng = random.Random(1)
+        for key in range(200):
+            h.arm(key, rng.uniform(0, 20_000))
+        while h.expected and h.wheel._tick < 1_000_000:
+            h.advance_to(h.wheel._tick + rng.randint(1, 500))
+            h.now += rng.random() * TimerWheel.RESOLUTION  # arm mid-tick
+            for key in rng.sample(sorted(h.expected), min(10, len(h.expected))):
+                if rng.random() < 0.5:
+                    h.cancel(key)
+                else:
+                    h.arm(key, rng.uniform(0, 20_000))
+        assert h.wrong == []
+        assert h.expected == {}
+        assert len(h.wheel) == 0
+
+    _run(check)
+
+
+def test_arming_an_idle_wheel_jumps_to_the_present() -> None:
+    def check(h: _Harness) -> None:
+        h.arm("a", 5)
+        h.advance_to(h.expected["a"])
+        h.now += 10_000.5
+        h.arm("b", 2)
+        assert h.expected["b"] == math.ceil(h.now + 2)
+        h.advance_to(h.expected["b"])
+        assert h.wrong == []
+        assert h.fired == 2
+
+    _run(check)
@@ -0,0 +1,29 @@
+from musicbot.track import Requester, Track
+
+_REQUESTER = Requester(1, 1)
+
+
+def test_fill_from_normalizes_like_the_constructor() -> None:
+    url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    placeholder = Track(url, url, 0, None, None, _REQUESTER, placeholder=True)
+    uploader = "".join(["Some ", "Channel"])  # built at runtime, not interned
+    resolved = Track(url, "Title", 212, None, None, _REQUESTER)
+    resolved.uploader = uploader
+    resolved.thumbnail_url = "https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg"
+
+    placeholder.fill_from(resolved)
+
+    assert not placeholder.placeholder
+    assert placeholder.uploader is Track(url, "", 0, None, "Some Channel", _REQUESTER).uploader
+    assert placeholder.thumbnail_url is None
+    assert placeholder.thumbnail == "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg"
+
+
+def test_fill_from_keeps_thumbnails_it_cant_derive() -> None:
+    url = "https://example.com/track"
+    placeholder = Track(url, url, 0, None, None, _REQUESTER, placeholder=True)
+    resolved = Track(url, "Title", 10, "https://example.com/cover.jpg", None, _REQUESTER)
+
+    placeholder.fill_from(resolved)
+
+    assert placeholder.thumbnail == "https://example.com/cover.jpg"